@@ -0,0 +1,53 @@
+"""Generate the requirements graphs images of example environments for the docs.
+
+Usage:
+    python commands/generate_requirements_graphs.py [ENV_CLASS_NAME ...]
+
+Draws every example environment if no class name is given.
+"""
+
+import sys
+from pathlib import Path
+from typing import List, Type
+
+import matplotlib.pyplot as plt
+
+from hcraft.env import HcraftEnv
+from hcraft.examples import EXAMPLE_ENVS
+
+REQUIREMENTS_DIR = Path("docs", "images", "requirements_graphs")
+
+
+def generate_requirements_graphs(env_class: Type[HcraftEnv]) -> None:
+    env = env_class()
+    requirements = env.world.requirements
+
+    width = max(requirements.depth, 10)
+    height = max(9 / 16 * width, requirements.width / requirements.depth * width)
+    resolution = max(64 * requirements.depth, 900)
+    dpi = resolution / width
+
+    fig, ax = plt.subplots()
+    plt.tight_layout()
+    fig.set_size_inches(width, height)
+    requirements.draw(ax, save_path=REQUIREMENTS_DIR / f"{env.name}.png", dpi=dpi)
+    plt.close()
+
+    requirements.draw(
+        engine="pyvis",
+        save_path=REQUIREMENTS_DIR / f"{env.name}.html",
+        with_web_uri=True,
+    )
+
+
+def main(env_names: List[str]) -> None:
+    REQUIREMENTS_DIR.mkdir(parents=True, exist_ok=True)
+    env_classes = EXAMPLE_ENVS
+    if env_names:
+        env_classes = [env for env in EXAMPLE_ENVS if env.__name__ in env_names]
+    for env_class in env_classes:
+        generate_requirements_graphs(env_class)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -53,6 +53,10 @@ from hcraft.env import HcraftEnv, HcraftState
 from hcraft.purpose import Purpose
 from hcraft.render.human import get_human_action, render_env_with_human
 from hcraft.task import GetItemTask, GoToZoneTask, PlaceItemTask
+from hcraft.examples import register_gym_envs
+
+# Examples gym environments are available as soon as hcraft is imported
+register_gym_envs()
 
 
 __all__ = [
@@ -68,6 +72,7 @@ __all__ = [
     "GetItemTask",
     "GoToZoneTask",
     "PlaceItemTask",
+    "register_gym_envs",
     "state",
     "transformation",
     "purpose",
@@ -20,7 +20,7 @@ class DoTransformation(Action):
         image = np.array(
             build_transformation_image(transformation, env.world.resources_path)
         )
-        action = env.world.transformations.index(transformation)
+        action = env.world.slot_from_transformation(transformation)
         self.transformation = transformation
         super().__init__(
             action,
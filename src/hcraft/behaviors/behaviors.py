@@ -21,7 +21,37 @@ if TYPE_CHECKING:
     from hcraft.transformation import Transformation
 
 
-class GetItem(Behavior):
+class _LastActionBehavior(Behavior):
+
+    """Behavior remembering the last action it gave for a given state.
+
+    Scripted rollouts often ask the same behavior again for the same state
+    (e.g. when the previous action did not change the state), in that case the
+    last action is given back without traversing the HEBGraph again.
+
+    Feature conditions read the full environment state (e.g. other zones
+    inventories), so the cache is keyed on the whole state, not only on the
+    observation.
+
+    """
+
+    _last_action: Optional[tuple] = None
+
+    def __call__(self, observation, behaviors_in_search=None, *args, **kwargs):
+        if behaviors_in_search is not None or args or kwargs:
+            # Nested calls depend on the current search, they cannot be reused.
+            return super().__call__(observation, behaviors_in_search, *args, **kwargs)
+        if self.graph.any_mode == "random":
+            return super().__call__(observation)
+        state_key = (np.asarray(observation).tobytes(), self.env.state.hashable)
+        if self._last_action is not None and self._last_action[0] == state_key:
+            return self._last_action[1]
+        action = super().__call__(observation)
+        self._last_action = (state_key, action)
+        return action
+
+
+class GetItem(_LastActionBehavior):
 
     """Behavior for getting an item"""
 
@@ -45,20 +75,15 @@ class GetItem(Behavior):
         graph = HEBGraph(behavior=self, all_behaviors=self.all_behaviors)
 
         # Any of the Tranformation that gives the item
-        for transfo in self.env.world.transformations:
-            produced_items = transfo.production("player")
-            item_is_added = self.item in produced_items
-            required_items = transfo.min_required("player")
-            item_is_not_required = self.item not in required_items
-            if item_is_added and item_is_not_required:
-                sub_behavior = Behavior(AbleAndPerformTransformation.get_name(transfo))
-                graph.add_node(sub_behavior)
+        for transfo in self.env.world.player_item_sources(self.item):
+            sub_behavior = Behavior(AbleAndPerformTransformation.get_name(transfo))
+            graph.add_node(sub_behavior)
 
         _ensure_has_node(graph, self)
         return graph
 
 
-class DropItem(Behavior):
+class DropItem(_LastActionBehavior):
 
     """Behavior for dropping an item"""
 
@@ -95,7 +120,7 @@ class DropItem(Behavior):
         return graph
 
 
-class PlaceItem(Behavior):
+class PlaceItem(_LastActionBehavior):
 
     """Behavior for getting an item in any of the given zones.
 
@@ -198,7 +223,7 @@ class PlaceItem(Behavior):
         return stacks is not None and self.item in [stack.item for stack in stacks]
 
 
-class ReachZone(Behavior):
+class ReachZone(_LastActionBehavior):
 
     """Behavior for going into a zone"""
 
@@ -231,7 +256,7 @@ class ReachZone(Behavior):
         return graph
 
 
-class AbleAndPerformTransformation(Behavior):
+class AbleAndPerformTransformation(_LastActionBehavior):
 
     """Behavior for abling then performing any transformation."""
 
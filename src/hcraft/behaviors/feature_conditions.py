@@ -23,7 +23,7 @@ class HasStack(FeatureCondition):
 
         self.stack = stack
         self.n_items = env.world.n_items
-        self.slot = env.world.items.index(stack.item)
+        self.slot = env.world.slot_from_item(stack.item)
 
     @staticmethod
     def get_name(stack: Stack):
@@ -46,7 +46,7 @@ class HasLessStack(FeatureCondition):
 
         self.stack = stack
         self.n_items = env.world.n_items
-        self.slot = env.world.items.index(stack.item)
+        self.slot = env.world.slot_from_item(stack.item)
 
     @staticmethod
     def get_name(stack: Stack):
@@ -94,8 +94,8 @@ class HasZoneItem(FeatureCondition):
         self.stack = stack
         self.n_items = env.world.n_items
         self.n_zones = env.world.n_zones
-        self.item_slot = env.world.zones_items.index(stack.item)
-        self.zone_slot = env.world.zones.index(zone) if zone is not None else None
+        self.item_slot = env.world.slot_from_zoneitem(stack.item)
+        self.zone_slot = env.world.slot_from_zone(zone) if zone is not None else None
 
         # We cheat for now, we will deal with partial observability later.
         self.state = env.state
@@ -271,7 +271,7 @@ That's it for this small customized env if you want more, be sure to check Trans
 """
 
 import collections
-from typing import TYPE_CHECKING, Dict, List, Optional, Union
+from typing import TYPE_CHECKING, Dict, FrozenSet, List, Optional, Tuple, Union
 
 import numpy as np
 
@@ -291,6 +291,9 @@ if TYPE_CHECKING:
     from hcraft.task import Task
     from hcraft.world import World
 
+_ACTION_MASKS_CACHE_SIZE = 4096
+"""Maximum number of states for which action masks are memoized."""
+
 # Gym is an optional dependency.
 try:
     import gym
@@ -337,6 +340,7 @@ class HcraftEnv(Env):
         self.max_step = max_step
         self.name = name
         self._all_behaviors = None
+        self._action_masks_cache: Dict[Tuple[bytes, ...], np.ndarray] = {}
 
         self.render_window = render_window
         self.render_mode = "rgb_array"
@@ -355,6 +359,8 @@ class HcraftEnv(Env):
             purpose = Purpose(tasks=purpose)
         self.purpose = purpose
         self.metadata = {}
+        self._planning_problem: Optional[HcraftPlanningProblem] = None
+        self._planning_key: Optional[Tuple[Purpose, FrozenSet[str]]] = None
 
     @property
     def truncated(self) -> bool:
@@ -396,7 +402,18 @@ class HcraftEnv(Env):
 
     def action_masks(self) -> np.ndarray:
         """Return boolean mask of valid actions."""
-        return np.array([t.is_valid(self.state) for t in self.world.transformations])
+        return self._action_masks().copy()
+
+    def _action_masks(self) -> np.ndarray:
+        """Memoized boolean mask of valid actions, must not be modified."""
+        state_key = self.state.hashable
+        action_masks = self._action_masks_cache.get(state_key)
+        if action_masks is None:
+            if len(self._action_masks_cache) >= _ACTION_MASKS_CACHE_SIZE:
+                self._action_masks_cache.clear()
+            action_masks = self.world.transformations_table.valid_mask(self.state)
+            self._action_masks_cache[state_key] = action_masks
+        return action_masks
 
     def step(self, action: int):
         """Perform one step in the environment given the index of a wanted transformation.
@@ -419,7 +436,10 @@ class HcraftEnv(Env):
         self.task_successes.step_reset()
         self.terminal_successes.step_reset()
 
-        success = self.state.apply(action)
+        # Reuse validity if already memoized, else only check the chosen action
+        action_masks = self._action_masks_cache.get(self.state.hashable)
+        is_valid = None if action_masks is None else bool(action_masks[action])
+        success = self.state.apply(action, is_valid=is_valid)
         if success:
             reward = self.purpose.reward(self.state)
         else:
@@ -513,6 +533,9 @@ class HcraftEnv(Env):
     def planning_problem(self, **kwargs) -> HcraftPlanningProblem:
         """Build this hcraft environment planning problem.
 
+        The problem is only built once per purpose and set of purpose tasks,
+        later calls copy it with the current state as initial state.
+
         Returns:
             Problem: Unified planning problem cooresponding to that environment.
 
@@ -538,7 +561,13 @@ class HcraftEnv(Env):
             assert env.purpose.is_terminated # Purpose is achieved
             ```
         """
-        return HcraftPlanningProblem(self.state, self.name, self.purpose, **kwargs)
+        planning_key = (self.purpose, self.purpose.task_names)
+        if self._planning_problem is None or self._planning_key != planning_key:
+            self._planning_problem = HcraftPlanningProblem(
+                self.state, self.name, self.purpose
+            )
+            self._planning_key = planning_key
+        return self._planning_problem.copy_to_state(self.state, **kwargs)
 
     def _step_output(self, reward: float, terminated: bool, truncated: bool):
         infos = {
@@ -54,44 +54,123 @@ See `hcraft.examples.minecraft` for more details.
 |:---------------------------------|:------------------|:------------------------------------------------|
 | Treasure-v1                      | `treasure`        | `hcraft.examples.treasure`                      |
 
+##Lazy loading
+
+Examples classes and modules are only imported when first accessed from `hcraft.examples`.
+All examples gym environments are registered when importing `hcraft`,
+`hcraft.register_gym_envs` returns their names:
+
+```python
+import gym
+import hcraft
+
+env = gym.make("MineHcraft-NoReward-v1")
+gym_names = hcraft.register_gym_envs()
+```
+
 
 """
 
-import hcraft.examples.minecraft as minecraft
-import hcraft.examples.minicraft as minicraft
-import hcraft.examples.random_simple as random_simple
-import hcraft.examples.recursive as recursive
-import hcraft.examples.light_recursive as light_recursive
-import hcraft.examples.tower as tower
-import hcraft.examples.treasure as treasure
-
-
-from hcraft.examples.minecraft import MineHcraftEnv, MINEHCRAFT_GYM_ENVS
-from hcraft.examples.minicraft import MINICRAFT_ENVS, MINICRAFT_GYM_ENVS
-from hcraft.examples.recursive import RecursiveHcraftEnv
-from hcraft.examples.light_recursive import LightRecursiveHcraftEnv
-from hcraft.examples.tower import TowerHcraftEnv
-from hcraft.examples.treasure import TreasureEnv
-from hcraft.examples.random_simple import RandomHcraftEnv
-
-EXAMPLE_ENVS = [
-    MineHcraftEnv,
-    *MINICRAFT_ENVS,
-    TowerHcraftEnv,
-    RecursiveHcraftEnv,
-    LightRecursiveHcraftEnv,
-    TreasureEnv,
-    # RandomHcraftEnv,
+import importlib
+from typing import TYPE_CHECKING, List
+
+if TYPE_CHECKING:
+    import hcraft.examples.minecraft as minecraft
+    import hcraft.examples.minicraft as minicraft
+    import hcraft.examples.random_simple as random_simple
+    import hcraft.examples.recursive as recursive
+    import hcraft.examples.light_recursive as light_recursive
+    import hcraft.examples.tower as tower
+    import hcraft.examples.treasure as treasure
+
+    from hcraft.examples.minecraft import MineHcraftEnv
+    from hcraft.examples.recursive import RecursiveHcraftEnv
+    from hcraft.examples.light_recursive import LightRecursiveHcraftEnv
+    from hcraft.examples.tower import TowerHcraftEnv
+    from hcraft.examples.random_simple import RandomHcraftEnv
+
+_SUBMODULES = [
+    "minecraft",
+    "minicraft",
+    "random_simple",
+    "recursive",
+    "light_recursive",
+    "tower",
+    "treasure",
 ]
 
-HCRAFT_GYM_ENVS = [
-    *MINEHCRAFT_GYM_ENVS,
-    *MINICRAFT_GYM_ENVS,
-    "TowerHcraft-v1",
-    "RecursiveHcraft-v1",
-    "LightRecursiveHcraft-v1",
-    "Treasure-v1",
-]
+_ATTRIBUTES_SUBMODULE = {
+    "MineHcraftEnv": "minecraft",
+    "MINEHCRAFT_GYM_ENVS": "minecraft",
+    "MINICRAFT_ENVS": "minicraft",
+    "MINICRAFT_GYM_ENVS": "minicraft",
+    "RecursiveHcraftEnv": "recursive",
+    "LightRecursiveHcraftEnv": "light_recursive",
+    "TowerHcraftEnv": "tower",
+    "TreasureEnv": "treasure",
+    "RandomHcraftEnv": "random_simple",
+}
+
+
+def register_gym_envs() -> List[str]:
+    """Register all examples as gym environments.
+
+    Returns:
+        List of all registered gym environments names.
+
+    """
+    for submodule in _SUBMODULES:
+        importlib.import_module(f"{__name__}.{submodule}")
+    return __getattr__("HCRAFT_GYM_ENVS")
+
+
+def _example_envs() -> list:
+    return [
+        __getattr__("MineHcraftEnv"),
+        *__getattr__("MINICRAFT_ENVS"),
+        __getattr__("TowerHcraftEnv"),
+        __getattr__("RecursiveHcraftEnv"),
+        __getattr__("LightRecursiveHcraftEnv"),
+        __getattr__("TreasureEnv"),
+        # __getattr__("RandomHcraftEnv"),
+    ]
+
+
+def _hcraft_gym_envs() -> List[str]:
+    for submodule in _SUBMODULES:
+        importlib.import_module(f"{__name__}.{submodule}")
+    return [
+        *__getattr__("MINEHCRAFT_GYM_ENVS"),
+        *__getattr__("MINICRAFT_GYM_ENVS"),
+        "TowerHcraft-v1",
+        "RecursiveHcraft-v1",
+        "LightRecursiveHcraft-v1",
+        "Treasure-v1",
+    ]
+
+
+_LAZY_LISTS = {
+    "EXAMPLE_ENVS": _example_envs,
+    "HCRAFT_GYM_ENVS": _hcraft_gym_envs,
+}
+
+
+def __getattr__(name: str):
+    if name in _SUBMODULES:
+        return importlib.import_module(f"{__name__}.{name}")
+    if name in _ATTRIBUTES_SUBMODULE:
+        submodule = importlib.import_module(f"{__name__}.{_ATTRIBUTES_SUBMODULE[name]}")
+        value = getattr(submodule, name)
+    elif name in _LAZY_LISTS:
+        value = _LAZY_LISTS[name]()
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__) | set(_LAZY_LISTS))
 
 
 __all__ = [
@@ -107,4 +186,5 @@ __all__ = [
     "LightRecursiveHcraftEnv",
     "RecursiveHcraftEnv",
     "TowerHcraftEnv",
+    "register_gym_envs",
 ]
@@ -71,36 +71,42 @@ class RandomHcraftEnv(HcraftEnv):
 
         """
 
+        n_inputs_of_item: Dict[Item, int] = {}
         for n_inputs, n_items in n_items_per_n_inputs.items():
-            self.items += [Item(f"{n_inputs}_{i}") for i in range(n_items)]
+            for i in range(n_items):
+                item = Item(f"{n_inputs}_{i}")
+                n_inputs_of_item[item] = n_inputs
+                self.items.append(item)
 
         transformations = []
 
         # Items with 0 inputs are accessible from the start
         accessible_items = []
         for item in self.items:
-            if item.name.startswith("0"):
+            if n_inputs_of_item[item] == 0:
                 search_item = Transformation(inventory_changes=[Yield(PLAYER, item)])
                 transformations.append(search_item)
                 accessible_items.append(item)
 
         # Other items are built with inputs
-        unaccessible_items = [
-            item for item in self.items if item not in accessible_items
-        ]
-        self.np_random.shuffle(unaccessible_items)
+        accessible_set = set(accessible_items)
+        unaccessible_items = [item for item in self.items if item not in accessible_set]
+        # Shuffling an index array is faster than a list, for the same draws
+        unaccessible_order = np.arange(len(unaccessible_items), dtype=np.intp)
+        self.np_random.shuffle(unaccessible_order)
+        unaccessible_items = [unaccessible_items[i] for i in unaccessible_order]
 
         while len(accessible_items) < len(self.items):
             new_accessible_item = unaccessible_items.pop()
             inventory_changes = [Yield(PLAYER, new_accessible_item)]
 
-            n_inputs = int(new_accessible_item.name.split("_")[0])
+            n_inputs = n_inputs_of_item[new_accessible_item]
             n_inputs = min(n_inputs, len(accessible_items))
 
             # Chooses randomly accessible items
-            input_items = list(
-                self.np_random.choice(accessible_items, size=n_inputs, replace=False)
-            )
+            # (same draws as np_random.choice without replacement, but on indices)
+            input_slots = self.np_random.permutation(len(accessible_items))[:n_inputs]
+            input_items = [accessible_items[slot] for slot in input_slots]
             inventory_changes += [Use(PLAYER, item, consume=1) for item in input_items]
 
             # Build recipe
@@ -12,6 +12,10 @@ class SuccessCounter:
         self.successes: Dict[Union[Task, TerminalGroup], Dict[int, bool]] = {
             element: {} for element in self.elements
         }
+        # Infos keys are computed once, in the same order as elements
+        names = [self._name(element) for element in self.elements]
+        self._done_keys = [self._is_done_str(name) for name in names]
+        self._rate_keys = [self._success_str(name) for name in names]
 
     def step_reset(self):
         """Set the state of elements."""
@@ -34,15 +38,15 @@ class SuccessCounter:
     @property
     def done_infos(self) -> Dict[str, bool]:
         return {
-            self._is_done_str(self._name(element)): element.terminated
-            for element in self.elements
+            key: element.terminated
+            for key, element in zip(self._done_keys, self.elements)
         }
 
     @property
     def rates_infos(self) -> Dict[str, float]:
         return {
-            self._success_str(self._name(element)): self._rate(element)
-            for element in self.elements
+            key: self._rate(element)
+            for key, element in zip(self._rate_keys, self.elements)
         }
 
     @staticmethod
@@ -84,8 +84,9 @@ If multiple terminal groups exists in the purpose, the PDDL goal will be the hig
 """
 
 from warnings import warn
-from typing import TYPE_CHECKING, Dict, Optional, Union, List
-from copy import deepcopy
+from collections import deque
+from typing import TYPE_CHECKING, Deque, Dict, Optional, Union, List
+from copy import copy, deepcopy
 
 
 from hcraft.transformation import Transformation, InventoryOwner
@@ -151,11 +152,42 @@ class HcraftPlanningProblem:
             )
         self.upf_problem: "Problem" = self._init_problem(state, name, purpose)
         self.plan: Optional["SequentialPlan"] = None
+        self._plan_actions: Deque[int] = deque()
         self.plans: List["SequentialPlan"] = []
         self.stats: List["Statistics"] = []
         self.timeout = timeout
         self.planner_name = planner_name
 
+    def copy_to_state(
+        self,
+        state: "HcraftState",
+        timeout: float = 60,
+        planner_name: Optional[str] = None,
+    ) -> "HcraftPlanningProblem":
+        """Copy this planning problem with its initial state set to the given state.
+
+        Clones the unified planning problem instead of building it again from the world.
+
+        Args:
+            state: HierarchyCraft state to use as initial state of the copy.
+            timeout: Time budget (s) for the plan to be found before giving up.
+                Set to -1 for no limit. Defaults to 60.
+            planner_name: Name of the planner to use. Defaults to None.
+
+        Returns:
+            HcraftPlanningProblem: A fresh planning problem without any plan.
+        """
+        problem = copy(self)
+        problem.upf_problem = self.upf_problem.clone()
+        problem.update_problem_to_state(problem.upf_problem, state)
+        problem.plan = None
+        problem._plan_actions = deque()
+        problem.plans = []
+        problem.stats = []
+        problem.timeout = timeout
+        problem.planner_name = planner_name
+        return problem
+
     def action_from_plan(self, state: "HcraftState") -> Optional[int]:
         """Get the next gym action from a given state.
 
@@ -171,12 +203,11 @@ class HcraftPlanningProblem:
         if self.plan is None:
             self.update_problem_to_state(self.upf_problem, state)
             self.solve()
-        if not self.plan.actions:  # Empty plan, nothing to do
+        if not self._plan_actions:  # Empty plan, nothing to do
             return None
-        plan_action_name = str(self.plan.actions.pop(0))
-        if not self.plan.actions:
+        action = self._plan_actions.popleft()
+        if not self._plan_actions:
             self.plan = None
-        action = int(plan_action_name.split("_")[0])
         return action
 
     def update_problem_to_state(self, upf_problem: "Problem", state: "HcraftState"):
@@ -223,6 +254,9 @@ class HcraftPlanningProblem:
         if results.plan is None:
             raise ValueError("Not plan could be found for this problem.")
         self.plan = deepcopy(results.plan)
+        self._plan_actions = deque(
+            int(action.action.name.split("_", 1)[0]) for action in self.plan.actions
+        )
         self.plans.append(deepcopy(results.plan))
         self.stats.append(_read_statistics(results))
         return results
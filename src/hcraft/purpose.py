@@ -96,9 +96,8 @@ Just like this last task, reward shaping subtasks are always optional.
 
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import TYPE_CHECKING, Dict, List, Optional, Set, Union
+from typing import TYPE_CHECKING, Dict, FrozenSet, List, Optional, Set, Union
 
-import networkx as nx
 import numpy as np
 
 from hcraft.requirements import RequirementNode, req_node_name
@@ -174,6 +173,7 @@ class Purpose:
                 Defaults to 1.0.
         """
         self.tasks: List[Task] = []
+        self._task_names: Set[str] = set()
         self.timestep_reward = timestep_reward
         self.shaping_value = shaping_value
         self.default_reward_shaping = default_reward_shaping
@@ -181,6 +181,20 @@ class Purpose:
 
         self.reward_shaping: Dict[Task, RewardShaping] = {}
         self.terminal_groups: List[TerminalGroup] = []
+        self._terminal_groups_by_name: Dict[str, TerminalGroup] = {}
+        self._optional_tasks: List[Task] = []
+        self._env: Optional["HcraftEnv"] = None
+
+        # Rewards of GetItemTask are computed all at once after build
+        self._get_item_tasks: List[Task] = []
+        self._get_item_slots = np.zeros(0, dtype=np.intp)
+        self._get_item_quantities = np.zeros(0, dtype=np.int32)
+        self._get_item_rewards = np.zeros(0, dtype=np.float64)
+        # Same for GoToZoneTask
+        self._go_to_zone_tasks: List[Task] = []
+        self._go_to_zone_slots = np.zeros(0, dtype=np.intp)
+        self._go_to_zone_rewards = np.zeros(0, dtype=np.float64)
+        self._other_tasks: List[Task] = []
 
         if isinstance(tasks, Task):
             tasks = [tasks]
@@ -220,10 +234,19 @@ class Purpose:
                 if not existing_group:
                     existing_group = TerminalGroup(terminal_group)
                     self.terminal_groups.append(existing_group)
+                    self._terminal_groups_by_name[terminal_group] = existing_group
                 existing_group.tasks.append(task)
+        else:
+            self._optional_tasks.append(task)
 
         self.reward_shaping[task] = reward_shaping
         self.tasks.append(task)
+        self._task_names.add(task.name)
+
+        if self.built:
+            # Build again so the new task and its subtasks are built and rewarded
+            self.built = False
+            self.build(self._env)
 
     def build(self, env: "HcraftEnv"):
         """
@@ -235,19 +258,30 @@ class Purpose:
         if self.built:
             return
 
+        self._env = env
         if not self.tasks:
+            # Nothing to build, reward and termination stay constant
+            self.built = True
             return
-        # Add reward shaping subtasks
+        # Add reward shaping subtasks, once for each distinct task
+        all_achievements_added = False
         for task in self.tasks:
-            subtasks = self._add_reward_shaping_subtasks(
-                task, env, self.reward_shaping[task]
-            )
+            reward_shaping = self.reward_shaping[task]
+            if reward_shaping == RewardShaping.ALL_ACHIVEMENTS:
+                # Every achievement of the world is the same for all tasks
+                if all_achievements_added:
+                    continue
+                all_achievements_added = True
+            subtasks = self._add_reward_shaping_subtasks(task, env, reward_shaping)
             for subtask in subtasks:
+                if subtask.name in self._task_names:
+                    continue
                 self.add_task(subtask, RewardShaping.NONE, terminal_groups=None)
 
         # Build all tasks
         for task in self.tasks:
             task.build(env.world)
+        self._build_rewards(env.world)
 
         self.built = True
 
@@ -258,7 +292,20 @@ class Purpose:
         reward = self.timestep_reward
         if not self.tasks:
             return reward
-        for task in self.tasks:
+        if not self.built:
+            for task in self.tasks:
+                reward += task.reward(state)
+            return reward
+        if self._get_item_tasks:
+            inventory = state.player_inventory[self._get_item_slots]
+            achieved = inventory >= self._get_item_quantities
+            achieved &= ~_terminated_mask(self._get_item_tasks)
+            reward += float(self._get_item_rewards[achieved].sum())
+        if self._go_to_zone_tasks:
+            reached = state.position[self._go_to_zone_slots] == 1
+            reached &= ~_terminated_mask(self._go_to_zone_tasks)
+            reward += float(self._go_to_zone_rewards[reached].sum())
+        for task in self._other_tasks:
             reward += task.reward(state)
         return reward
 
@@ -268,33 +315,44 @@ class Purpose:
         """
         if not self.tasks:
             return False
-        for task in self.tasks:
+        if not self.built:
+            self._end_terminal_tasks(self.tasks, state)
+            return self.terminated
+        if self._get_item_tasks:
+            inventory = state.player_inventory[self._get_item_slots]
+            achieved = inventory >= self._get_item_quantities
+            for row in np.flatnonzero(achieved):
+                self._get_item_tasks[row].terminated = True
+        if self._go_to_zone_tasks:
+            reached = state.position[self._go_to_zone_slots] == 1
+            for row in np.flatnonzero(reached):
+                self._go_to_zone_tasks[row].terminated = True
+        self._end_terminal_tasks(self._other_tasks, state)
+        return self.terminated
+
+    def _end_terminal_tasks(self, tasks: List[Task], state: "HcraftState") -> None:
+        for task in tasks:
             task.is_terminal(state)
-        for terminal_group in self.terminal_groups:
-            if terminal_group.terminated:
-                return True
-        return False
 
     def reset(self) -> None:
         """Reset the purpose."""
         for task in self.tasks:
             task.reset()
 
+    @property
+    def task_names(self) -> FrozenSet[str]:
+        """Names of all the tasks of the purpose."""
+        return frozenset(self._task_names)
+
     @property
     def optional_tasks(self) -> List[Task]:
         """List of tasks in no terminal group hence being optinal."""
-        terminal_tasks = []
-        for group in self.terminal_groups:
-            terminal_tasks += group.tasks
-        return [task for task in self.tasks if task not in terminal_tasks]
+        return list(self._optional_tasks)
 
     @property
     def terminated(self) -> bool:
         """True if any of the terminal groups are terminated."""
-        return any(
-            all(task.terminated for task in terminal_group.tasks)
-            for terminal_group in self.terminal_groups
-        )
+        return any(terminal_group.terminated for terminal_group in self.terminal_groups)
 
     @property
     def best_terminal_group(self) -> TerminalGroup:
@@ -312,11 +370,39 @@ class Purpose:
         self._best_terminal_group = best_terminal_group
         return best_terminal_group
 
+    def _build_rewards(self, world: "World") -> None:
+        get_item_tasks: List[GetItemTask] = []
+        go_to_zone_tasks: List[GoToZoneTask] = []
+        self._other_tasks = []
+        for task in self.tasks:
+            if type(task) is GetItemTask:
+                get_item_tasks.append(task)
+            elif type(task) is GoToZoneTask:
+                go_to_zone_tasks.append(task)
+            else:
+                self._other_tasks.append(task)
+        self._get_item_tasks = get_item_tasks
+        self._get_item_slots = np.array(
+            [world.slot_from_item(task.item_stack.item) for task in get_item_tasks],
+            dtype=np.intp,
+        )
+        self._get_item_quantities = np.array(
+            [task.item_stack.quantity for task in get_item_tasks], dtype=np.int32
+        )
+        self._get_item_rewards = np.array(
+            [task._reward for task in get_item_tasks], dtype=np.float64
+        )
+        self._go_to_zone_tasks = go_to_zone_tasks
+        self._go_to_zone_slots = np.array(
+            [world.slot_from_zone(task.zone) for task in go_to_zone_tasks],
+            dtype=np.intp,
+        )
+        self._go_to_zone_rewards = np.array(
+            [task._reward for task in go_to_zone_tasks], dtype=np.float64
+        )
+
     def _terminal_group_from_name(self, name: str) -> Optional[TerminalGroup]:
-        if name not in self.terminal_groups:
-            return None
-        group_id = self.terminal_groups.index(name)
-        return self.terminal_groups[group_id]
+        return self._terminal_groups_by_name.get(name)
 
     def _add_reward_shaping_subtasks(
         self, task: Task, env: "HcraftEnv", reward_shaping: RewardShaping
@@ -353,6 +439,13 @@ class Purpose:
         return ",".join(tasks_str)
 
 
+def _terminated_mask(tasks: List[Task]) -> np.ndarray:
+    """Boolean mask of the tasks already terminated, read from the tasks themselves."""
+    return np.fromiter(
+        (task.terminated for task in tasks), dtype=bool, count=len(tasks)
+    )
+
+
 def platinium_purpose(
     items: List[Item],
     zones: List[Zone],
@@ -403,9 +496,10 @@ def _required_subtasks(
             f"for given task type: {type(task)} of {task}"
         )
 
-    requirements_acydigraph = env.world.requirements.acydigraph
+    requirements = env.world.requirements
+    requirements_acydigraph = requirements.acydigraph
     for requirement_node in goal_requirement_nodes:
-        for ancestor in nx.ancestors(requirements_acydigraph, requirement_node):
+        for ancestor in requirements.ancestors[requirement_node]:
             if ancestor == "START#":
                 continue
             ancestor_node = requirements_acydigraph.nodes[ancestor]
@@ -447,28 +541,22 @@ def _inputs_subtasks(task: Task, world: "World", shaping_reward: float) -> List[
             f"Unsupported reward shaping {RewardShaping.INPUTS_ACHIVEMENT}"
             f"for given task type: {type(task)} of {task}"
         )
-    transfo_giving_item = [
-        transfo
-        for transfo in world.transformations
-        if goal_item in transfo.production("player")
-        and goal_item not in transfo.min_required("player")
-    ]
-    transfo_placing_zone_item = [
-        transfo
-        for transfo in world.transformations
-        if goal_zone_item in transfo.produced_zones_items
-        and goal_zone_item not in transfo.min_required_zones_items
-    ]
-    transfo_going_to_goal_zone = [
-        transfo
-        for transfo in world.transformations
-        if transfo.destination is not None and transfo.destination == goal_zone
-    ]
-    relevant_transformations = (
-        transfo_giving_item + transfo_placing_zone_item + transfo_going_to_goal_zone
-    )
-
-    for transfo in relevant_transformations:
+    transformations = world.transformations
+    if goal_item is not None:
+        # Only transformations giving the item are relevant
+        transformations = world.player_item_sources(goal_item)
+    for transfo in transformations:
+        gives_item = goal_item is not None
+        places_zone_item = (
+            goal_zone_item is not None
+            and goal_zone_item in transfo.produced_zones_items
+            and goal_zone_item not in transfo.min_required_zones_items
+        )
+        goes_to_goal_zone = (
+            transfo.destination is not None and transfo.destination == goal_zone
+        )
+        if not (gives_item or places_zone_item or goes_to_goal_zone):
+            continue
         relevant_items |= transfo.consumption("player")
         relevant_zone_items |= transfo.consumption("current_zone")
         relevant_zone_items |= transfo.consumption("destination")
@@ -492,9 +580,12 @@ def _build_reward_shaping_subtasks(
 ) -> List[Task]:
     subtasks = []
     if items:
+        items = dict.fromkeys(items)
         subtasks += [GetItemTask(item, reward=shaping_reward) for item in items]
     if zones:
+        zones = dict.fromkeys(zones)
         subtasks += [GoToZoneTask(zone, reward=shaping_reward) for zone in zones]
     if zone_items:
+        zone_items = dict.fromkeys(zone_items)
         subtasks += [PlaceItemTask(item, reward=shaping_reward) for item in zone_items]
     return subtasks
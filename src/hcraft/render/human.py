@@ -24,10 +24,13 @@ def get_human_action(
         The action found using the UI.
 
     """
-    action_chosen = False
-    while not action_chosen:
-        action = env.render_window.update_rendering(additional_events, fps)
-        action_chosen = action is not None or can_be_none
+    render_window = env.render_window
+    action = render_window.update_rendering(additional_events, fps)
+    while action is None and not can_be_none:
+        # Nothing can change on screen until the UI receives an event
+        if additional_events is None and not render_window.wait_for_event():
+            continue
+        action = render_window.update_rendering(additional_events, fps)
     return action
 
 
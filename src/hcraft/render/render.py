@@ -28,6 +28,36 @@ if TYPE_CHECKING:
 
     from hcraft.env import HcraftEnv
 
+_BACKGROUND_COLOR = (198, 198, 198)
+
+
+def _window_event_types() -> List[int]:
+    """Pygame event types after which the window needs to be repainted."""
+    return [
+        pygame.ACTIVEEVENT,
+        pygame.VIDEOEXPOSE,
+        pygame.VIDEORESIZE,
+        pygame.WINDOWSHOWN,
+        pygame.WINDOWEXPOSED,
+        pygame.WINDOWRESTORED,
+        pygame.WINDOWMAXIMIZED,
+        pygame.WINDOWRESIZED,
+        pygame.WINDOWSIZECHANGED,
+    ]
+
+
+def _ui_event_types() -> List[int]:
+    """Pygame event types consumed by the user interface."""
+    return [
+        pygame.QUIT,
+        pygame.MOUSEBUTTONDOWN,
+        pygame.MOUSEBUTTONUP,
+        pygame.MOUSEMOTION,
+        pygame.MOUSEWHEEL,
+        pygame.KEYDOWN,
+        pygame.KEYUP,
+    ] + _window_event_types()
+
 
 class HcraftWindow:
     """Render window for any HierarchyCraft environment UI."""
@@ -69,9 +99,11 @@ class HcraftWindow:
 
         self.env = None
         self.clock = None
+        self.event_types = _ui_event_types()
         self.screen = None
         self.menus = {}
         self.window_shape = window_shape
+        self._background_painted = False
 
         self.player_inventory_display = player_inventory_display
         self.zone_inventory_display = zone_inventory_display
@@ -97,7 +129,9 @@ class HcraftWindow:
         os.environ["SDL_VIDEO_CENTERED"] = "1"
         self.screen = pygame.display.set_mode(self.window_shape)
         pygame.display.set_caption("HierarchyCraft")
+
         self._loading_screen()
+        self._background_painted = False
 
         # Create menus
         self.menus = self.make_menus(
@@ -131,16 +165,31 @@ class HcraftWindow:
         if fps is not None:
             self.clock.tick(fps)
 
-        # Paint background
-        self.screen.fill((198, 198, 198))
-
         # Execute main from principal menu if is enabled
-        events = pygame.event.get()
+        events = pygame.event.get(eventtype=self.event_types)
+        # Drop the remaining events the UI never reads so the queue cannot fill up
+        pygame.event.clear(pump=False)
         if additional_events is not None:
             events += additional_events
+        events = coalesce_events(events)
+        window_event_types = _window_event_types()
         for event in events:
             if event.type == pygame.QUIT:
                 sys.exit()
+            if event.type in window_event_types:
+                # The window content may have been lost
+                self._background_painted = False
+
+        screen = pygame.display.get_surface()
+        if screen is not None and screen is not self.screen:
+            self.screen = screen
+            self._background_painted = False
+
+        # Paint the whole background only once, then behind redrawn widgets
+        full_redraw = not self._background_painted
+        if full_redraw:
+            self.screen.fill(_BACKGROUND_COLOR)
+            self._background_painted = True
 
         # Update inventories
         state = self.env.state
@@ -151,25 +200,34 @@ class HcraftWindow:
             self.menus["player_inventory"].update_inventory(
                 state.player_inventory, state.discovered_items, events, title=title
             )
-            self.menus["player_inventory"].draw(self.screen)
 
         # Update position
         if self.menus["position"]:
             self.menus["position"].update_position(
                 state.position, state.discovered_zones, events
             )
-            self.menus["position"].draw(self.screen)
 
         # Update zone inventory
         if self.menus["zone_inventory"]:
             self.menus["zone_inventory"].update_inventory(
                 state.current_zone_inventory, state.discovered_zones_items, events
             )
-            self.menus["zone_inventory"].draw(self.screen)
 
         # Update actions menu
         self.menus["actions"].update_transformations(self.env, events)
-        self.menus["actions"].draw(self.screen)
+
+        # Draw only widgets that changed
+        dirty_rects = []
+        for menu_name in ("player_inventory", "position", "zone_inventory", "actions"):
+            menu = self.menus[menu_name]
+            if not menu or not (menu.dirty or full_redraw):
+                continue
+            menu_rect = menu.get_rect()
+            if not full_redraw:
+                self.screen.fill(_BACKGROUND_COLOR, menu_rect)
+            menu.draw(self.screen)
+            menu.dirty = False
+            dirty_rects.append(menu_rect)
 
         # Gather action taken if any
         action_taken = None
@@ -178,9 +236,29 @@ class HcraftWindow:
             action_taken: int = selected_widget.apply()
 
         # Update surface
-        pygame.display.update()
+        if full_redraw:
+            pygame.display.update()
+        elif dirty_rects:
+            pygame.display.update(dirty_rects)
         return action_taken
 
+    def wait_for_event(self, timeout: int = 16) -> bool:
+        """Block until the UI receives an event or until the timeout expires.
+
+        The received event is put back in the queue for the next rendering update.
+
+        Args:
+            timeout: Maximum waiting time in milliseconds.
+
+        Returns:
+            True if an event was received, False if the timeout expired.
+        """
+        event = pygame.event.wait(timeout)
+        if event.type == pygame.NOEVENT:
+            return False
+        pygame.event.post(event)
+        return True
+
     def make_menus(
         self,
         player_inventory_display: DisplayMode,
@@ -313,6 +391,34 @@ class HcraftWindow:
         pygame.display.update()
 
 
+def coalesce_events(events: List["Event"]) -> List["Event"]:
+    """Compact a frame of events before dispatching it to every menu.
+
+    Consecutive mouse motions are merged into the last one with their relative
+    movements summed, and repeated key presses of a key that is already down are
+    dropped. Mouse button events are all kept, in order.
+    """
+    compacted = []
+    keys_down = set()
+    for event in events:
+        if event.type == pygame.MOUSEMOTION:
+            previous = compacted[-1] if compacted else None
+            if previous is not None and previous.type == pygame.MOUSEMOTION:
+                rel = (previous.rel[0] + event.rel[0], previous.rel[1] + event.rel[1])
+                compacted[-1] = pygame.event.Event(
+                    pygame.MOUSEMOTION, {**event.dict, "rel": rel}
+                )
+                continue
+        elif event.type == pygame.KEYDOWN:
+            if event.key in keys_down:
+                continue
+            keys_down.add(event.key)
+        elif event.type == pygame.KEYUP:
+            keys_down.discard(event.key)
+        compacted.append(event)
+    return compacted
+
+
 def menus_sizes(
     n_items: int, n_zones_items: int, n_zones: int, window_shape: Tuple[int, int]
 ) -> Dict[str, Tuple[int, int]]:
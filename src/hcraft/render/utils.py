@@ -2,6 +2,8 @@
 
 import logging
 import os
+import sys
+from functools import lru_cache
 from io import BytesIO
 from pathlib import Path
 from typing import TYPE_CHECKING, List, Optional, Tuple, Union
@@ -39,6 +41,16 @@ def obj_image_path(obj: Union[Item, Zone], resources_path: Path):
         raise TypeError(f"Unsupported type for loading images: {type(obj)}")
 
 
+@lru_cache(maxsize=256)
+def _decode_image(image_path: Path) -> Optional[Image.Image]:
+    """Decode the image at the given path once, None if there is no such image."""
+    try:
+        with Image.open(image_path) as image:
+            return image.convert("RGBA")
+    except FileNotFoundError:
+        return None
+
+
 def load_image(resources_path: Path, obj: Union[Item, Zone]) -> Optional[Image.Image]:
     """Load a PIL image for and obj in a world.
 
@@ -53,20 +65,29 @@ def load_image(resources_path: Path, obj: Union[Item, Zone]) -> Optional[Image.I
     if obj is None:
         return None
 
+    resources_path = Path(resources_path)
     image_path = obj_image_path(obj, resources_path)
-
-    try:
-        image = Image.open(image_path).convert("RGBA")
-    except FileNotFoundError:
-        return None
-
     if isinstance(obj, Item):
         wanted_size = (120, 120)
     elif isinstance(obj, Zone):
         wanted_size = (699, 394)
 
+    image = _load_scaled_image(image_path, wanted_size)
+    if image is None:
+        return None
+    return image.copy()
+
+
+@lru_cache(maxsize=512)
+def _load_scaled_image(
+    image_path: Path, wanted_size: Tuple[int, int]
+) -> Optional[Image.Image]:
+    image = _decode_image(image_path)
+    if image is None:
+        return None
+
     scale_ratio = _get_scale_ratio(image.size, wanted_size)
-    image = image.resize(
+    return image.resize(
         (
             int(scale_ratio * image.size[0]),
             int(scale_ratio * image.size[1]),
@@ -74,8 +95,6 @@ def load_image(resources_path: Path, obj: Union[Item, Zone]) -> Optional[Image.I
         resample=Image.Resampling.NEAREST,
     )
 
-    return image
-
 
 def draw_text_on_image(
     image: "Image.Image",
@@ -100,7 +119,7 @@ def draw_text_on_image(
     image_draw = ImageDraw.Draw(image)
     text_px_size = int(3 * text_relative_size * min(image.size))
     text_pt_size = int(0.75 * text_px_size)
-    font = ImageFont.truetype(font_path, size=text_pt_size)
+    font = _font(font_path, size=text_pt_size)
     font_offset = (int(0.05 * image.size[0]), int(0.95 * image.size[1]))
     image_draw.text(font_offset, text, font=font, anchor="lb")
     return image
@@ -128,7 +147,13 @@ def create_text_image(
     """
     if image_size[0] is None:
         image_size = (image_size[1] * len(text) // 4, image_size[1])
+    return _text_image(text, str(resources_path), tuple(image_size)).copy()
 
+
+@lru_cache(maxsize=512)
+def _text_image(
+    text: str, resources_path: str, image_size: Tuple[int, int]
+) -> "Image.Image":
     image = Image.new("RGBA", image_size, (0, 0, 0, 0))
     draw = ImageDraw.Draw(image)
 
@@ -137,7 +162,7 @@ def create_text_image(
     text_pt_size = min(
         int(0.60 * image_size[1]), int(4 * 0.60 * image_size[0] / len(text))
     )
-    font = ImageFont.truetype(font_path, size=text_pt_size)
+    font = _font(font_path, size=text_pt_size)
     draw.text((center_x, center_y), text, fill=(200, 200, 200), font=font, anchor="mm")
     return image
 
@@ -206,15 +231,17 @@ def build_transformation_image(
             zone_image.thumbnail((214, 120), Image.LANCZOS)
 
     items_images = removed_images + [arrow_image] + added_images + destination_images
-    total_width = sum(i.width for i in items_images)
     height = max(i.height for i in items_images)
-    transformation_image = Image.new("RGBA", (total_width, height))
-    x_offset = 0
-    for i, image in enumerate(items_images):
-        transformation_image.paste(image, (x_offset, (height - image.height) // 2))
-        x_offset += image.width
-
-    return transformation_image
+    items_arrays = []
+    for image in items_images:
+        if image.mode != "RGBA":
+            image = image.convert("RGBA")
+        top_padding = (height - image.height) // 2
+        bottom_padding = height - image.height - top_padding
+        items_arrays.append(
+            np.pad(np.asarray(image), ((top_padding, bottom_padding), (0, 0), (0, 0)))
+        )
+    return Image.fromarray(np.concatenate(items_arrays, axis=1))
 
 
 def load_or_create_image(obj: Union[Stack, Zone], resources_path: Path, bg_color=None):
@@ -252,13 +279,21 @@ def load_or_create_images(
 def _add_background_elipsis(
     image: "Image.Image", bg_color: Tuple[int, int, int]
 ) -> "Image.Image":
-    image_bg = Image.new("RGBA", image.size, (0, 0, 0, 0))
-    draw = ImageDraw.Draw(image_bg)
-    draw.ellipse((0, 0, image.width, image.height), fill=(*bg_color, 25))
+    image_bg = _elipsis_background(image.size, tuple(bg_color)).copy()
     image_bg.alpha_composite(image)
     return image_bg
 
 
+@lru_cache(maxsize=64)
+def _elipsis_background(
+    size: Tuple[int, int], bg_color: Tuple[int, int, int]
+) -> "Image.Image":
+    image_bg = Image.new("RGBA", size, (0, 0, 0, 0))
+    draw = ImageDraw.Draw(image_bg)
+    draw.ellipse((0, 0, size[0], size[1]), fill=(*bg_color, 25))
+    return image_bg
+
+
 def surface_to_rgb_array(surface: "Surface") -> np.ndarray:
     """Transforms a pygame surface to a conventional rgb array.
 
@@ -269,9 +304,25 @@ def surface_to_rgb_array(surface: "Surface") -> np.ndarray:
         A rgb_array representing the given surface.
 
     """
+    if surface.get_bytesize() == 4:
+        rgb_array = np.empty((surface.get_height(), surface.get_width(), 3), np.uint8)
+        _copy_rgb_from_buffer(surface, rgb_array)
+        return rgb_array
     return pygame.surfarray.array3d(surface).swapaxes(0, 1)
 
 
+def _copy_rgb_from_buffer(surface: "Surface", out: np.ndarray) -> None:
+    """Copy the rgb channels of a 32 bits surface row by row from its raw buffer."""
+    width, height = surface.get_size()
+    buffer = surface.get_buffer()
+    pixels = np.frombuffer(buffer, dtype=np.uint8)
+    pixels = pixels.reshape(height, surface.get_pitch() // 4, 4)[:, :width]
+    for channel, shift in enumerate(surface.get_shifts()[:3]):
+        byte = shift // 8 if sys.byteorder == "little" else 3 - shift // 8
+        out[..., channel] = pixels[..., byte]
+    del pixels, buffer  # Unlock the surface
+
+
 def _font_path(resources_path: str):
     from hcraft.world import _default_resources_path
 
@@ -281,6 +332,12 @@ def _font_path(resources_path: str):
     return font_path
 
 
+@lru_cache(maxsize=128)
+def _font(font_path: str, size: int) -> "ImageFont.FreeTypeFont":
+    """Load a font only once for each size."""
+    return ImageFont.truetype(font_path, size=size)
+
+
 def _get_scale_ratio(initial_shape, wanted_shape) -> float:
     if wanted_shape[0] == initial_shape[0] or wanted_shape[1] == initial_shape[1]:
         return 1
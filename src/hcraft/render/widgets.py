@@ -1,7 +1,7 @@
 """ Widgets for rendering of the HierarchyCraft environments """
 
 from enum import Enum
-from typing import TYPE_CHECKING, Dict, List, Optional, Union
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple, Union
 
 import numpy as np
 
@@ -93,8 +93,13 @@ class InventoryWidget(Menu):
 
         self.button_id_to_item = {}
         self.old_quantity = {}
-        for item in self.items:
-            self._build_button(item)
+        self.items_buttons: List[Tuple[Union["Button", "PyImage"], int]] = []
+        for item_slot, item in enumerate(self.items):
+            button = self._build_button(item)
+            self.items_buttons.append((button, item_slot))
+
+        self.dirty = True
+        self._last_key: Optional[Tuple[bytes, bytes, Optional[str]]] = None
 
     def update_inventory(
         self,
@@ -103,18 +108,18 @@ class InventoryWidget(Menu):
         events,
         title: Optional[str] = None,
     ) -> bool:
-        items_buttons = [
-            widget
-            for widget in self.get_widgets()
-            if isinstance(widget, (Button, PyImage))
-        ]
-        for button in items_buttons:
-            self._update_button(button, inventory, discovered)
-        if title is not None:
-            self.set_title(title)
+        key = (inventory.tobytes(), discovered.tobytes(), title)
+        if key != self._last_key:
+            for button, item_slot in self.items_buttons:
+                self._update_button(button, item_slot, inventory, discovered)
+            if title is not None:
+                self.set_title(title)
+            self._last_key = key
+            self.dirty = True
+        self.dirty |= bool(events)
         return super().update(events)
 
-    def _build_button(self, item: Item) -> None:
+    def _build_button(self, item: Item) -> Union["Button", "PyImage"]:
         image = self.base_images[item]
         if image is not None:
             image = draw_text_on_image(image, "0", self.resources_path)
@@ -123,15 +128,16 @@ class InventoryWidget(Menu):
             button: "Button" = self.add.button(str(item))
         button.is_selectable = False
         self.button_id_to_item[button.get_id()] = item
+        return button
 
     def _update_button(
         self,
         button: Union["Button", "PyImage"],
+        item_slot: int,
         inventory: np.ndarray,
         discovered: np.ndarray,
     ):
-        item = self.button_id_to_item[button.get_id()]
-        item_slot = self.items.index(item)
+        item = self.items[item_slot]
         quantity = inventory[item_slot]
         old_quantity = self.old_quantity.get(item, None)
 
@@ -210,13 +216,21 @@ class TransformationsWidget(Menu):
         self.display_mode = DisplayMode(display_mode)
         self.content_display_mode = ContentMode(content_display_mode)
         self.button_id_to_transfo = {}
-        self.old_display = {}
-        self.old_legal = {}
+        self.old_shown = {}
         self.buttons_base_image: Dict[str, "Image"] = {}
         self.buttons_hidden_image: Dict[str, "Image"] = {}
+        self._last_state_key: Optional[Tuple[bytes, ...]] = None
+        self._last_legal: Optional[np.ndarray] = None
+        self._last_discovered: Optional[np.ndarray] = None
+        self._last_title: Optional[str] = None
+        self.dirty = True
+        buttons = []
         for index, transfo in enumerate(self.transformations):
             button = self._build_transformation_button(transfo, index)
             self.button_id_to_transfo[button.get_id()] = transfo
+            buttons.append(button)
+        # Buttons are indexed like the transformations, hence like actions
+        self.transformations_buttons: Tuple["Button", ...] = tuple(buttons)
 
     def _build_transformation_button(
         self, transfo: Transformation, action_id: int
@@ -240,14 +254,36 @@ class TransformationsWidget(Menu):
         return button
 
     def update_transformations(self, env: "HcraftEnv", events) -> bool:
-        action_is_legal = env.action_masks()
-        action_buttons = [
-            widget for widget in self.get_widgets() if isinstance(widget, Button)
-        ]
-        for button in action_buttons:
-            self._update_button(button, env, action_is_legal)
+        state_key = _state_key(env)
+        if state_key != self._last_state_key:
+            # Legality and discoveries can only change with the state.
+            legal = env.action_masks()
+            discovered = env.state.discovered_transformations
+            if self._last_legal is None:
+                changed = np.ones_like(legal, dtype=bool)
+            else:
+                changed = (legal ^ self._last_legal) | (
+                    discovered ^ self._last_discovered
+                )
+            for index in np.flatnonzero(changed):
+                self._update_button(
+                    self.transformations_buttons[index],
+                    int(index),
+                    bool(legal[index]),
+                    bool(discovered[index]),
+                )
+            # Masks may be updated in place, so compare to copies next time
+            self._last_legal = legal.copy()
+            self._last_discovered = discovered.copy()
+            self._last_state_key = state_key
+            self.dirty = True
         if env.max_step is not None:
-            self.set_title(self._remaining_text(env.max_step - env.current_step))
+            title = self._remaining_text(env.max_step - env.current_step)
+            if title != self._last_title:
+                self.set_title(title)
+                self._last_title = title
+                self.dirty = True
+        self.dirty |= bool(events)
         return super().update(events)
 
     @staticmethod
@@ -255,36 +291,30 @@ class TransformationsWidget(Menu):
         return f"Actions ({actions_remaining} remaining)"
 
     def _update_button(
-        self, button: "Button", env: "HcraftEnv", action_is_legal: np.ndarray
+        self, button: "Button", action: int, legal: bool, discovered: bool
     ):
-        transfo = self.button_id_to_transfo[button.get_id()]
-        action = env.world.transformations.index(transfo)
-        discovered = env.state.discovered_transformations[action]
-        legal = action_is_legal[action]
-        old_display = self.old_display.get(button.get_id(), None)
-        old_legal = self.old_legal.get(button.get_id(), None)
-
+        """Refresh a button whose legality or discovery changed."""
+        transfo = self.transformations[action]
         button_image = self.buttons_base_image.get(button.get_id(), None)
-        display_content = show_content(self.content_display_mode, discovered)
-        self.old_display[button.get_id()] = display_content
-        self.old_legal[button.get_id()] = legal
-
-        if old_display != display_content or legal != old_legal:
-            if display_content:
-                if button_image:
-                    if not legal:
-                        button_image = button_image.convert("LA").convert("RGBA")
-                    self._update_button_image(button, button_image)
-                else:
-                    button.set_title(str(transfo))
+        if show_content(self.content_display_mode, discovered):
+            if button_image:
+                if not legal:
+                    button_image = button_image.convert("LA").convert("RGBA")
+                self._update_button_image(button, button_image)
             else:
-                if button_image:
-                    hidden_image = self.buttons_hidden_image[button.get_id()]
-                    self._update_button_image(button, hidden_image)
-                else:
-                    button.set_title(str(action))
+                button.set_title(str(transfo))
+        else:
+            if button_image:
+                hidden_image = self.buttons_hidden_image[button.get_id()]
+                self._update_button_image(button, hidden_image)
+            else:
+                button.set_title(str(action))
 
-        if show_button(self.display_mode, legal, discovered):
+        shown = show_button(self.display_mode, legal, discovered)
+        if self.old_shown.get(button.get_id(), None) == shown:
+            return
+        self.old_shown[button.get_id()] = shown
+        if shown:
             button.show()
         else:
             button.hide()
@@ -349,27 +379,32 @@ class PostitionWidget(Menu):
         self.display_mode = DisplayMode(display_mode)
         self.button_id_to_zone = {}
         self.old_quantity = {}
-        for zone in self.zones:
-            self._build_button(zone)
+        self.zones_buttons: List[Tuple["Button", int]] = []
+        for zone_slot, zone in enumerate(self.zones):
+            button = self._build_button(zone)
+            self.zones_buttons.append((button, zone_slot))
+
+        self.dirty = True
+        self._last_key: Optional[Tuple[bytes, bytes]] = None
 
     def update_position(
         self, position: np.ndarray, discovered: np.ndarray, events
     ) -> bool:
-        buttons = [
-            widget for widget in self.get_widgets() if isinstance(widget, Button)
-        ]
-        for button in buttons:
-            zone = self.button_id_to_zone[button.get_id()]
-            zone_slot = self.zones.index(zone)
-            if show_button(
-                self.display_mode, position[zone_slot], discovered[zone_slot]
-            ):
-                button.show()
-            else:
-                button.hide()
+        key = (position.tobytes(), discovered.tobytes())
+        if key != self._last_key:
+            for button, zone_slot in self.zones_buttons:
+                if show_button(
+                    self.display_mode, position[zone_slot], discovered[zone_slot]
+                ):
+                    button.show()
+                else:
+                    button.hide()
+            self._last_key = key
+            self.dirty = True
+        self.dirty |= bool(events)
         return super().update(events)
 
-    def _build_button(self, zone: Zone) -> None:
+    def _build_button(self, zone: Zone) -> "Button":
         image = self.base_images[zone]
         font = _font_path(self.resources_path)
         button: "Button" = self.add.button("", border_width=0)
@@ -395,6 +430,13 @@ class PostitionWidget(Menu):
             )
         button.is_selectable = False
         self.button_id_to_zone[button.get_id()] = zone
+        return button
+
+
+def _state_key(env: "HcraftEnv") -> Tuple[bytes, ...]:
+    """Cheap hashable snapshot of the parts of the state the UI depends on."""
+    state = env.state
+    return state.hashable + (state.discovered_transformations.tobytes(),)
 
 
 def show_button(display_mode: DisplayMode, is_current: bool, discovered: bool) -> bool:
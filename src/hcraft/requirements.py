@@ -185,6 +185,7 @@ class Requirements:
         self.graph = nx.MultiDiGraph()
         self._digraph: nx.DiGraph = None
         self._acydigraph: nx.DiGraph = None
+        self._ancestors: Dict[str, Set[str]] = None
         self._build()
 
     def draw(
@@ -261,6 +262,23 @@ class Requirements:
         self._acydigraph = break_cycles_through_level(self.digraph)
         return self._acydigraph
 
+    @property
+    def ancestors(self) -> Dict[str, Set[str]]:
+        """Ancestors of every node of the acyclic requirements graph."""
+        if self._ancestors is not None:
+            return self._ancestors
+        acydigraph = self.acydigraph
+        predecessors = acydigraph.pred
+        ancestors: Dict[str, Set[str]] = {}
+        for node in nx.topological_sort(acydigraph):
+            node_ancestors = set()
+            for predecessor in predecessors[node]:
+                node_ancestors.add(predecessor)
+                node_ancestors |= ancestors[predecessor]
+            ancestors[node] = node_ancestors
+        self._ancestors = ancestors
+        return self._ancestors
+
     @property
     def depth(self) -> int:
         """Depth of the requirements graph."""
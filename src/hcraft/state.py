@@ -1,4 +1,4 @@
-from typing import TYPE_CHECKING, Dict, Optional
+from typing import TYPE_CHECKING, Dict, Optional, Tuple
 
 import numpy as np
 
@@ -65,6 +65,19 @@ class HcraftState:
             )
         )
 
+    @property
+    def hashable(self) -> Tuple[bytes, bytes, bytes]:
+        """Hashable snapshot of the player inventory, position and zones inventories.
+
+        Two states with the same snapshot allow the same transformations.
+
+        """
+        return (
+            self.player_inventory.tobytes(),
+            self.position.tobytes(),
+            self.zones_inventories.tobytes(),
+        )
+
     def amount_of(self, item: "Item", owner: Optional["Zone"] = "player") -> int:
         """Current amount of the given item owned by owner.
 
@@ -77,11 +90,11 @@ class HcraftState:
         """
 
         if owner in self.world.zones:
-            zone_index = self.world.zones.index(owner)
-            zone_item_index = self.world.zones_items.index(item)
+            zone_index = self.world.slot_from_zone(owner)
+            zone_item_index = self.world.slot_from_zoneitem(item)
             return int(self.zones_inventories[zone_index, zone_item_index])
 
-        item_index = self.world.items.index(item)
+        item_index = self.world.slot_from_item(item)
         return int(self.player_inventory[item_index])
 
     def has_discovered(self, zone: "Zone") -> bool:
@@ -93,7 +106,7 @@ class HcraftState:
         Returns:
             bool: True if the zone was discovered.
         """
-        zone_index = self.world.zones.index(zone)
+        zone_index = self.world.slot_from_zone(zone)
         return bool(self.discovered_zones[zone_index])
 
     @property
@@ -123,17 +136,21 @@ class HcraftState:
                 zones_invs[zone] = zone_inv
         return zones_invs
 
-    def apply(self, action: int) -> bool:
+    def apply(self, action: int, is_valid: Optional[bool] = None) -> bool:
         """Apply the given action to update the state.
 
         Args:
             action (int): Index of the transformation to apply.
+            is_valid (Optional[bool]): Validity of the action in this state if already known.
+                If None, the validity is checked by the transformation. Defaults to None.
 
         Returns:
             bool: True if the transformation was applied succesfuly. False otherwise.
         """
         choosen_transformation = self.world.transformations[action]
-        if not choosen_transformation.is_valid(self):
+        if is_valid is None:
+            is_valid = choosen_transformation.is_valid(self)
+        if not is_valid:
             return False
         choosen_transformation.apply(
             self.player_inventory,
@@ -147,7 +164,7 @@ class HcraftState:
         """Reset the state to it's initial value."""
         self.player_inventory = np.zeros(self.world.n_items, dtype=np.int32)
         for stack in self.world.start_items:
-            item_slot = self.world.items.index(stack.item)
+            item_slot = self.world.slot_from_item(stack.item)
             self.player_inventory[item_slot] = stack.quantity
 
         self.position = np.zeros(self.world.n_zones, dtype=np.int32)
@@ -163,7 +180,7 @@ class HcraftState:
         for zone, zone_stacks in self.world.start_zones_items.items():
             zone_slot = self.world.slot_from_zone(zone)
             for stack in zone_stacks:
-                item_slot = self.world.zones_items.index(stack.item)
+                item_slot = self.world.slot_from_zoneitem(stack.item)
                 self.zones_inventories[zone_slot, item_slot] = stack.quantity
 
         self.discovered_items = np.zeros(self.world.n_items, dtype=np.ubyte)
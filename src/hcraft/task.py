@@ -13,6 +13,14 @@ if TYPE_CHECKING:
 class Task:
     """Abstract base class for all HierarchyCraft tasks."""
 
+    __slots__ = (
+        "name",
+        "terminated",
+        "_terminate_player_items",
+        "_terminate_position",
+        "_terminate_zones_items",
+    )
+
     def __init__(self, name: str) -> None:
         self.name = name
         self.terminated = False
@@ -63,6 +71,8 @@ class Task:
 class AchievementTask(Task):
     """Task giving a reward to the player only the first time achieved."""
 
+    __slots__ = ("_reward",)
+
     def __init__(self, name: str, reward: float):
         super().__init__(name)
         self._reward = reward
@@ -82,17 +92,21 @@ class AchievementTask(Task):
 class GetItemTask(AchievementTask):
     """Task of getting a given quantity of an item."""
 
+    __slots__ = ("item_stack", "_item_slot")
+
     def __init__(self, item_stack: Union[Item, Stack], reward: float = 1.0):
         self.item_stack = _stack_item(item_stack)
         super().__init__(name=self.get_name(self.item_stack), reward=reward)
 
     def build(self, world: "World") -> None:
         super().build(world)
-        item_slot = world.items.index(self.item_stack.item)
-        self._terminate_player_items[item_slot] = self.item_stack.quantity
+        self._item_slot = world.slot_from_item(self.item_stack.item)
+        self._terminate_player_items[self._item_slot] = self.item_stack.quantity
 
     def _is_terminal(self, state: "HcraftState") -> bool:
-        return np.all(state.player_inventory >= self._terminate_player_items)
+        # Other slots are required at zero, only the item slot needs a check
+        quantity = state.player_inventory[self._item_slot]
+        return bool(quantity >= self.item_stack.quantity)
 
     @staticmethod
     def get_name(stack: Stack):
@@ -104,17 +118,19 @@ class GetItemTask(AchievementTask):
 class GoToZoneTask(AchievementTask):
     """Task to go to a given zone."""
 
+    __slots__ = ("zone",)
+
     def __init__(self, zone: Zone, reward: float = 1.0) -> None:
         super().__init__(name=self.get_name(zone), reward=reward)
         self.zone = zone
 
     def build(self, world: "World"):
         super().build(world)
-        zone_slot = world.zones.index(self.zone)
+        zone_slot = world.slot_from_zone(self.zone)
         self._terminate_position[zone_slot] = 1
 
     def _is_terminal(self, state: "HcraftState") -> bool:
-        return np.all(state.position == self._terminate_position)
+        return np.array_equal(state.position, self._terminate_position)
 
     @staticmethod
     def get_name(zone: Zone):
@@ -129,6 +145,8 @@ class PlaceItemTask(AchievementTask):
 
     """
 
+    __slots__ = ("item_stack", "zone")
+
     def __init__(
         self,
         item_stack: Union[Item, Stack],
@@ -146,7 +164,7 @@ class PlaceItemTask(AchievementTask):
             zones_slots = np.arange(self._terminate_zones_items.shape[0])
         else:
             zones_slots = np.array([world.slot_from_zone(self.zone)])
-        zone_item_slot = world.zones_items.index(self.item_stack.item)
+        zone_item_slot = world.slot_from_zoneitem(self.item_stack.item)
         self._terminate_zones_items[
             zones_slots, zone_item_slot
         ] = self.item_stack.quantity
@@ -139,8 +139,9 @@ because the player only observe the current zone items.
 """
 
 
-from typing import TYPE_CHECKING, Dict, List, Optional, Set, Tuple, Union, Any
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Set, Tuple, Union
 from enum import Enum
+from functools import partial
 from dataclasses import dataclass
 
 import numpy as np
@@ -237,6 +238,7 @@ InventoryChanges = Dict[
     Union[List[Union[Item, Stack]], Dict[Zone, List[Union[Item, Stack]]]],
 ]
 InventoryOperations = Dict[InventoryOperation, np.ndarray]
+InventoryUpdate = Callable[[np.ndarray, np.ndarray, np.ndarray], None]
 
 
 class Transformation:
@@ -291,6 +293,18 @@ class Transformation:
 
     """
 
+    __slots__ = (
+        "name",
+        "destination",
+        "_destination",
+        "zone",
+        "_zone",
+        "_changes_list",
+        "inventory_changes",
+        "_inventory_operations",
+        "_inventory_updates",
+    )
+
     def __init__(
         self,
         name: Optional[str] = None,
@@ -321,6 +335,7 @@ class Transformation:
         self._inventory_operations: Optional[
             Dict[InventoryOwner, InventoryOperations]
         ] = None
+        self._inventory_updates: Tuple[InventoryUpdate, ...] = ()
 
         self.name = name if name is not None else self.__repr__()
 
@@ -331,18 +346,8 @@ class Transformation:
         zones_inventories: np.ndarray,
     ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
         """Apply the transformation in place on the given state."""
-
-        for owner, operations in self._inventory_operations.items():
-            operation_arr = operations[InventoryOperation.APPLY]
-            if operation_arr is not None:
-                _update_inventory(
-                    owner,
-                    player_inventory,
-                    position,
-                    zones_inventories,
-                    self._destination,
-                    operation_arr,
-                )
+        for update in self._inventory_updates:
+            update(player_inventory, position, zones_inventories)
         if self._destination is not None:
             position[...] = self._destination
 
@@ -492,7 +497,7 @@ class Transformation:
         zeros = np.zeros_like(zones_inventories)
         added = zones_changes.get(InventoryOperation.ADD, zeros.copy())
         removed = zones_changes.get(InventoryOperation.REMOVE, zeros.copy())
-        infs = np.inf * np.ones_like(zones_inventories)
+        infs = np.full_like(zones_inventories, np.inf, dtype=np.float64)
         max_items = zones_changes.get(InventoryOperation.MAX, infs.copy())
         min_items = zones_changes.get(InventoryOperation.MIN, zeros.copy())
 
@@ -554,9 +559,9 @@ class Transformation:
     ):
         owner = InventoryOwner(owner)
         if owner is InventoryOwner.PLAYER:
-            world_items_list = world.items
+            n_items, slot_from_item = world.n_items, world.slot_from_item
         else:
-            world_items_list = world.zones_items
+            n_items, slot_from_item = world.n_zones_items, world.slot_from_zoneitem
 
         for operation, stacks in operations.items():
             operation = InventoryOperation(operation)
@@ -564,50 +569,58 @@ class Transformation:
             if operation is InventoryOperation.MAX:
                 default_value = np.inf
             if owner is InventoryOwner.ZONES:
-                operation_arr = self._build_zones_items_op(
-                    stacks, world.zones, world.zones_items, default_value
-                )
+                operation_arr = self._build_zones_items_op(stacks, world, default_value)
             else:
                 operation_arr = self._build_operation_array(
-                    stacks, world_items_list, default_value
+                    stacks, n_items, slot_from_item, default_value
                 )
             if owner not in self._inventory_operations:
                 self._inventory_operations[owner] = {}
             self._inventory_operations[owner][operation] = operation_arr
 
     def _build_apply_operations(self):
+        inventory_updates = []
         for owner, operations in self._inventory_operations.items():
             apply_op = InventoryOperation.APPLY
             apply_arr = _build_apply_operation_array(operations)
             self._inventory_operations[owner][apply_op] = apply_arr
+            if apply_arr is not None:
+                inventory_updates.append(
+                    _build_inventory_update(owner, apply_arr, self._destination)
+                )
+        self._inventory_updates = tuple(inventory_updates)
 
     def _build_operation_array(
         self,
         stacks: List[Stack],
-        world_items_list: List["Item"],
+        n_items: int,
+        slot_from_item: Callable[["Item"], int],
         default_value: int = 0,
     ) -> np.ndarray:
-        operation = default_value * np.ones(len(world_items_list), dtype=np.int32)
-        for stack in stacks:
-            item_slot = world_items_list.index(stack.item)
-            operation[item_slot] = stack.quantity
+        dtype = np.result_type(default_value, np.int32)
+        operation = np.full(n_items, default_value, dtype=dtype)
+        items_slots = [slot_from_item(stack.item) for stack in stacks]
+        operation[items_slots] = [stack.quantity for stack in stacks]
         return operation
 
     def _build_zones_items_op(
         self,
         stacks_per_zone: Dict[Zone, List["Stack"]],
-        zones: List[Zone],
-        zones_items: List["Item"],
+        world: "World",
         default_value: float = 0.0,
     ) -> np.ndarray:
-        operation = default_value * np.ones(
-            (len(zones), len(zones_items)), dtype=np.int32
+        dtype = np.result_type(default_value, np.int32)
+        operation = np.full(
+            (world.n_zones, world.n_zones_items), default_value, dtype=dtype
         )
+        zones_slots, items_slots, quantities = [], [], []
         for zone, stacks in stacks_per_zone.items():
-            zone_slot = zones.index(zone)
+            zone_slot = world.slot_from_zone(zone)
             for stack in stacks:
-                item_slot = zones_items.index(stack.item)
-                operation[zone_slot, item_slot] = stack.quantity
+                zones_slots.append(zone_slot)
+                items_slots.append(world.slot_from_zoneitem(stack.item))
+                quantities.append(stack.quantity)
+        operation[zones_slots, items_slots] = quantities
         return operation
 
     def __str__(self) -> str:
@@ -742,26 +755,210 @@ class Transformation:
         return effects_text
 
 
-def _update_inventory(
+class TransformationsTable:
+    """Structure-of-arrays view over the preconditions of built transformations.
+
+    Inventories bounds and position constraints of every transformation
+    are stacked into arrays (one row per transformation),
+    so that all of them can be checked at once with a few numpy operations.
+
+    """
+
+    __slots__ = (
+        "player_min",
+        "player_max",
+        "current_min",
+        "current_max",
+        "destination_min",
+        "destination_max",
+        "zone",
+        "has_zone",
+        "destination",
+        "destination_slot",
+        "has_destination",
+        "zones_rows",
+        "zones_min",
+        "zones_max",
+    )
+
+    def __init__(self, transformations: List[Transformation], world: "World"):
+        """
+        Args:
+            transformations: Transformations already built on the given world.
+            world: World the transformations were built on.
+        """
+        n_transformations = len(transformations)
+        items_shape = (n_transformations, world.n_items)
+        zones_items_shape = (n_transformations, world.n_zones_items)
+        self.player_min = np.zeros(items_shape)
+        self.player_max = np.full(items_shape, np.inf)
+        self.current_min = np.zeros(zones_items_shape)
+        self.current_max = np.full(zones_items_shape, np.inf)
+        self.destination_min = np.zeros(zones_items_shape)
+        self.destination_max = np.full(zones_items_shape, np.inf)
+        self.zone = np.zeros((n_transformations, world.n_zones), dtype=np.int32)
+        self.has_zone = np.zeros(n_transformations, dtype=bool)
+        self.destination = np.zeros_like(self.zone)
+        self.destination_slot = np.zeros(n_transformations, dtype=np.intp)
+        self.has_destination = np.zeros(n_transformations, dtype=bool)
+
+        zones_shape = (world.n_zones, world.n_zones_items)
+        zones_rows, zones_min, zones_max = [], [], []
+        for row, transfo in enumerate(transformations):
+            operations = transfo._inventory_operations
+            _fill_bounds(operations, PLAYER, row, self.player_min, self.player_max)
+            _fill_bounds(
+                operations, CURRENT_ZONE, row, self.current_min, self.current_max
+            )
+            if transfo._zone is not None:
+                self.zone[row] = transfo._zone
+                self.has_zone[row] = True
+            if transfo._destination is not None:
+                self.destination[row] = transfo._destination
+                self.destination_slot[row] = transfo._destination.nonzero()[0][0]
+                self.has_destination[row] = True
+                _fill_bounds(
+                    operations,
+                    DESTINATION,
+                    row,
+                    self.destination_min,
+                    self.destination_max,
+                )
+            zones_ops = operations.get(InventoryOwner.ZONES, {})
+            if zones_ops.keys() & {InventoryOperation.MIN, InventoryOperation.MAX}:
+                zones_rows.append(row)
+                zones_min.append(
+                    zones_ops.get(InventoryOperation.MIN, np.zeros(zones_shape))
+                )
+                zones_max.append(
+                    zones_ops.get(InventoryOperation.MAX, np.full(zones_shape, np.inf))
+                )
+
+        # Specific zones bounds are only stacked for transformations having some
+        self.zones_rows = np.array(zones_rows, dtype=np.intp)
+        n_rows = len(zones_rows)
+        self.zones_min = np.array(zones_min, dtype=float).reshape(n_rows, *zones_shape)
+        self.zones_max = np.array(zones_max, dtype=float).reshape(n_rows, *zones_shape)
+
+    def valid_mask(self, state: "HcraftState") -> np.ndarray:
+        """Boolean mask of the transformations that are valid in the given state."""
+        position = state.position
+        current_slots = position.nonzero()[0]
+        if current_slots.size == 1:
+            # One-hot position, zone constraints are simple columns lookups
+            current_slot = current_slots[0]
+            valid = ~self.has_zone | (self.zone[:, current_slot] > 0)
+            valid &= ~(self.has_destination & (self.destination_slot == current_slot))
+        else:
+            valid = ~self.has_zone | (self.zone @ position > 0)
+            at_destination = np.all(self.destination == position, axis=1)
+            valid &= ~(self.has_destination & at_destination)
+        valid &= _in_bounds(state.player_inventory, self.player_min, self.player_max)
+
+        zones_inventories = state.zones_inventories
+        if zones_inventories.size == 0:
+            return valid
+        if current_slots.size == 1:
+            current_inventory = zones_inventories[current_slot]
+            valid &= _in_bounds(current_inventory, self.current_min, self.current_max)
+        else:
+            # Current zone bounds apply to every zone the player is in
+            current_inventories = zones_inventories[current_slots, np.newaxis]
+            in_bounds = _in_bounds(
+                current_inventories, self.current_min, self.current_max
+            )
+            valid &= np.all(in_bounds, axis=0)
+        destinations_inventories = zones_inventories[self.destination_slot]
+        valid &= _in_bounds(
+            destinations_inventories, self.destination_min, self.destination_max
+        )
+        if self.zones_rows.size > 0:
+            valid[self.zones_rows] &= np.all(
+                (zones_inventories >= self.zones_min)
+                & (zones_inventories <= self.zones_max),
+                axis=(1, 2),
+            )
+        return valid
+
+
+def _fill_bounds(
+    operations: Dict[InventoryOwner, InventoryOperations],
+    owner: InventoryOwner,
+    row: int,
+    min_table: np.ndarray,
+    max_table: np.ndarray,
+) -> None:
+    owner_ops = operations.get(owner, {})
+    if InventoryOperation.MIN in owner_ops:
+        min_table[row] = owner_ops[InventoryOperation.MIN]
+    if InventoryOperation.MAX in owner_ops:
+        max_table[row] = owner_ops[InventoryOperation.MAX]
+
+
+def _in_bounds(
+    inventories: np.ndarray, min_table: np.ndarray, max_table: np.ndarray
+) -> np.ndarray:
+    return np.all((inventories >= min_table) & (inventories <= max_table), axis=-1)
+
+
+def _build_inventory_update(
     owner: InventoryOwner,
+    operation_arr: np.ndarray,
+    destination: Optional[np.ndarray],
+) -> InventoryUpdate:
+    """Build the in place update of the given owner inventory.
+
+    Each update only does the indexing needed for its owner,
+    so that applying a transformation does not branch on owners at every step.
+
+    """
+    if owner is PLAYER:
+        return partial(_update_player_inventory, operation_arr)
+    if owner is CURRENT_ZONE:
+        return partial(_update_current_zone_inventory, operation_arr)
+    if owner is DESTINATION:
+        destination_slot: int = destination.nonzero()[0]
+        return partial(_update_zone_inventory, destination_slot, operation_arr)
+    if owner is InventoryOwner.ZONES:
+        return partial(_update_zones_inventories, operation_arr)
+    raise NotImplementedError
+
+
+def _update_player_inventory(
+    operation_arr: np.ndarray,
     player_inventory: np.ndarray,
     position: np.ndarray,
     zones_inventories: np.ndarray,
-    destination: np.ndarray,
+) -> None:
+    player_inventory[...] += operation_arr
+
+
+def _update_current_zone_inventory(
     operation_arr: np.ndarray,
-):
-    position_slot: int = position.nonzero()[0]
-    if owner is PLAYER:
-        player_inventory[...] += operation_arr
-    elif owner is CURRENT_ZONE:
-        zones_inventories[position_slot, :] += operation_arr
-    elif owner is DESTINATION:
-        destination_slot: int = destination.nonzero()[0]
-        zones_inventories[destination_slot, :] += operation_arr
-    elif owner is InventoryOwner.ZONES:
-        zones_inventories[...] += operation_arr
-    else:
-        raise NotImplementedError
+    player_inventory: np.ndarray,
+    position: np.ndarray,
+    zones_inventories: np.ndarray,
+) -> None:
+    zones_inventories[position.nonzero()[0], :] += operation_arr
+
+
+def _update_zone_inventory(
+    zone_slot: int,
+    operation_arr: np.ndarray,
+    player_inventory: np.ndarray,
+    position: np.ndarray,
+    zones_inventories: np.ndarray,
+) -> None:
+    zones_inventories[zone_slot, :] += operation_arr
+
+
+def _update_zones_inventories(
+    operation_arr: np.ndarray,
+    player_inventory: np.ndarray,
+    position: np.ndarray,
+    zones_inventories: np.ndarray,
+) -> None:
+    zones_inventories[...] += operation_arr
 
 
 def _build_apply_operation_array(
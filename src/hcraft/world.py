@@ -41,7 +41,11 @@ from typing import Dict, List, Optional, Set, Tuple, Union
 
 from hcraft.elements import Item, Stack, Zone
 from hcraft.requirements import RequirementNode, Requirements, req_node_name
-from hcraft.transformation import Transformation, InventoryOwner
+from hcraft.transformation import (
+    InventoryOwner,
+    Transformation,
+    TransformationsTable,
+)
 
 
 def _default_resources_path() -> Path:
@@ -71,6 +75,8 @@ class World:
 
     def __post_init__(self):
         self._requirements = None
+        self._transformations_table = None
+        self._player_item_sources: Optional[Dict[Item, List[Transformation]]] = None
 
         if self.order_world:
             item_rank = partial(
@@ -88,6 +94,10 @@ class World:
             )
             self.zones.sort(key=zone_rank)
 
+        self._items_slots = _slots(self.items)
+        self._zones_slots = _slots(self.zones)
+        self._zones_items_slots = _slots(self.zones_items)
+        self._transformations_slots = _slots(self.transformations)
         for transfo in self.transformations:
             transfo.build(self)
 
@@ -117,17 +127,53 @@ class World:
             self._requirements = Requirements(self)
         return self._requirements
 
+    @property
+    def transformations_table(self) -> TransformationsTable:
+        """Stacked preconditions of all transformations to check them all at once.
+
+        See `hcraft.transformation.TransformationsTable` for more details.
+
+        """
+        if self._transformations_table is None:
+            self._transformations_table = TransformationsTable(
+                self.transformations, self
+            )
+        return self._transformations_table
+
+    def player_item_sources(self, item: Item) -> List[Transformation]:
+        """Transformations giving the item to the player without requiring it."""
+        if self._player_item_sources is None:
+            player = InventoryOwner.PLAYER
+            sources: Dict[Item, List[Transformation]] = {}
+            for transfo in self.transformations:
+                required_items = transfo.min_required(player)
+                for produced_item in transfo.production(player):
+                    if produced_item not in required_items:
+                        sources.setdefault(produced_item, []).append(transfo)
+            self._player_item_sources = sources
+        return self._player_item_sources.get(item, [])
+
     def slot_from_item(self, item: Item) -> int:
         """Item's slot in the world"""
-        return self.items.index(item)
+        return self._items_slots[item]
 
     def slot_from_zone(self, zone: Zone) -> int:
         """Zone's slot in the world"""
-        return self.zones.index(zone)
+        return self._zones_slots[zone]
 
     def slot_from_zoneitem(self, zone: Zone) -> int:
         """Item's slot in the world as a zone item."""
-        return self.zones_items.index(zone)
+        return self._zones_items_slots[zone]
+
+    def slot_from_transformation(self, transformation: "Transformation") -> int:
+        """Transformation's slot in the world, hence its action."""
+        return self._transformations_slots[transformation]
+
+
+def _slots(
+    objs: List[Union[Item, Zone, "Transformation"]],
+) -> Dict[Union[Item, Zone, "Transformation"], int]:
+    return {obj: slot for slot, obj in enumerate(objs)}
 
 
 def world_from_transformations(
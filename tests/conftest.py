@@ -0,0 +1,24 @@
+from typing import TYPE_CHECKING
+
+import pytest
+
+from hcraft.examples import EXAMPLE_ENVS
+
+if TYPE_CHECKING:
+    from hcraft.env import HcraftEnv
+
+
+@pytest.fixture(
+    scope="session",
+    params=[
+        pytest.param(
+            env_class,
+            id=env_class.__name__,
+            marks=pytest.mark.xdist_group(env_class.__name__),
+        )
+        for env_class in EXAMPLE_ENVS
+    ],
+)
+def example_env(request: pytest.FixtureRequest) -> "HcraftEnv":
+    """Example environment built once and shared by tests that do not step it."""
+    return request.param()
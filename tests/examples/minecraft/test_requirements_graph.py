@@ -1,3 +1,4 @@
+import networkx as nx
 import pytest
 import pytest_check as check
 
@@ -14,11 +15,16 @@ from hcraft.requirements import RequirementNode, req_node_name
 IRON_PICKAXE = MC_TOOLS_BY_TYPE_AND_MATERIAL[ToolType.PICKAXE][Material.IRON]
 
 
+@pytest.fixture(scope="class")
+def minehcraft_graph() -> nx.MultiDiGraph:
+    env = MineHcraftEnv()
+    return env.world.requirements.graph
+
+
 class TestMineHcraftReqGraph:
     @pytest.fixture(autouse=True)
-    def setup_method(self):
-        self.env = MineHcraftEnv()
-        self.graph = self.env.world.requirements.graph
+    def setup_method(self, minehcraft_graph: nx.MultiDiGraph):
+        self.graph = minehcraft_graph
 
     def test_wood_require_forest(self):
         forest_node = req_node_name(zones.FOREST, RequirementNode.ZONE)
@@ -2,7 +2,7 @@ import pytest
 import pytest_check as check
 
 from hcraft.examples.random_simple.env import RandomHcraftEnv
-from tests.custom_checks import check_isomorphic, check_not_isomorphic
+from tests.custom_checks import check_not_isomorphic, check_same_nodes_and_edges
 
 
 class TestRandomHcraft:
@@ -29,7 +29,7 @@ class TestRandomHcraft:
         env = RandomHcraftEnv(self.n_items_per_n_inputs, seed=42)
         env2 = RandomHcraftEnv(self.n_items_per_n_inputs, seed=42)
         check.equal(env.seed, env2.seed)
-        check_isomorphic(
+        check_same_nodes_and_edges(
             env.world.requirements.graph,
             env2.world.requirements.graph,
         )
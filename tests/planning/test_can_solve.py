@@ -1,11 +1,8 @@
-from typing import TYPE_CHECKING, Type
+from typing import Type
 
 import pytest
 import pytest_check as check
 
-import os
-
-
 from hcraft.examples import EXAMPLE_ENVS
 from hcraft.examples.minecraft import MineHcraftEnv
 from hcraft.examples.minicraft import (
@@ -14,9 +11,7 @@ from hcraft.examples.minicraft import (
 from hcraft.env import HcraftEnv
 from hcraft.examples.recursive import RecursiveHcraftEnv
 
-if TYPE_CHECKING:
-    from unified_planning.io import PDDLWriter
-
+pytestmark = pytest.mark.xdist_group("planning")
 
 KNOWN_TO_FAIL_FOR_PLANNER = {
     "enhsp": [MiniHCraftBlockedUnlockPickup],
@@ -24,30 +19,32 @@ KNOWN_TO_FAIL_FOR_PLANNER = {
 }
 
 
+def _solve_flat_params():
+    params = []
+    for planner_name in ("enhsp", "aries"):
+        for env_class in EXAMPLE_ENVS:
+            if env_class == MineHcraftEnv:
+                continue
+            marks = ()
+            if env_class in KNOWN_TO_FAIL_FOR_PLANNER[planner_name]:
+                reason = (
+                    f"{planner_name} planner is known to fail on {env_class.__name__}"
+                )
+                marks = pytest.mark.xfail(reason=reason, run=False)
+            params.append(pytest.param(env_class, planner_name, marks=marks))
+    return params
+
+
 @pytest.mark.slow
-@pytest.mark.parametrize(
-    "env_class", [env for env in EXAMPLE_ENVS if env != MineHcraftEnv]
-)
-@pytest.mark.parametrize("planner_name", ["enhsp", "aries"])
+@pytest.mark.parametrize("env_class,planner_name", _solve_flat_params())
 def test_solve_flat(env_class: Type[HcraftEnv], planner_name: str):
-    up = pytest.importorskip("unified_planning")
-    write = False
+    pytest.importorskip("unified_planning")
     env = env_class(max_step=200)
     problem = env.planning_problem(timeout=5, planner_name=planner_name)
 
-    if write:
-        writer: "PDDLWriter" = up.io.PDDLWriter(problem.upf_problem)
-        pddl_dir = os.path.join("planning", "pddl", env.name)
-        os.makedirs(pddl_dir, exist_ok=True)
-        writer.write_domain(os.path.join(pddl_dir, "domain.pddl"))
-        writer.write_problem(os.path.join(pddl_dir, "problem.pddl"))
-
     optional_requirements = {"enhsp": "up_enhsp", "aries": "up_aries"}
     pytest.importorskip(optional_requirements[planner_name])
 
-    if env_class in KNOWN_TO_FAIL_FOR_PLANNER[planner_name]:
-        pytest.xfail(f"{planner_name} planner is known to fail on {env.name}")
-
     done = False
     _observation = env.reset()
     while not done:
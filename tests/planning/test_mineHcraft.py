@@ -1,8 +1,5 @@
 """ Module testing utils functions for hcraft behaviors. """
 
-from pathlib import Path
-from typing import TYPE_CHECKING
-
 import pytest
 import pytest_check as check
 
@@ -16,8 +13,7 @@ from hcraft.examples.minecraft.tools import (
 )
 from hcraft.task import GetItemTask
 
-if TYPE_CHECKING:
-    from unified_planning.io import PDDLWriter
+pytestmark = pytest.mark.xdist_group("planning")
 
 WOODEN_PICKAXE = MC_TOOLS_BY_TYPE_AND_MATERIAL[ToolType.PICKAXE][Material.WOOD]
 STONE_PICKAXE = MC_TOOLS_BY_TYPE_AND_MATERIAL[ToolType.PICKAXE][Material.STONE]
@@ -109,23 +105,15 @@ KNOWN_TO_FAIL_ITEM_FOR_PLANNER = {
 
 
 @pytest.mark.slow
-@pytest.mark.parametrize("item", [item.name for item in ALL_ITEMS])
+@pytest.mark.parametrize("item", sorted(item.name for item in ALL_ITEMS))
 @pytest.mark.parametrize("planner_name", ["enhsp", "aries"])
 def test_get_item_flat(planner_name: str, item: str):
     """All items should be gettable by planning behavior."""
-    up = pytest.importorskip("unified_planning")
+    pytest.importorskip("unified_planning")
     task = GetItemTask(Item(item))
     env = MineHcraftEnv(purpose=task, max_step=500)
-    write = False
     problem = env.planning_problem(timeout=5, planner_name=planner_name)
 
-    if write:
-        writer: "PDDLWriter" = up.io.PDDLWriter(problem.upf_problem)
-        pddl_dir = Path("planning", "pddl", env.name)
-        pddl_dir.mkdir(exist_ok=True)
-        writer.write_domain(pddl_dir / "MineHCraftDomain.pddl")
-        writer.write_problem(pddl_dir / f"Get{item.capitalize()}Problem.pddl")
-
     optional_requirements = {"enhsp": "up_enhsp", "aries": "up_aries"}
     pytest.importorskip(optional_requirements[planner_name])
     if item in KNOWN_TO_FAIL_ITEM_FOR_PLANNER[planner_name]:
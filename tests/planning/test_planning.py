@@ -1,9 +1,14 @@
-from typing import Optional, Type, List
+from typing import TYPE_CHECKING, Optional, Type, List
 import warnings
 import pytest
+from hcraft.elements import Item
 from hcraft.env import HcraftEnv
+from hcraft.task import GetItemTask
 from tests.envs import classic_env
 
+if TYPE_CHECKING:
+    from hcraft.planning import HcraftPlanningProblem
+
 
 class TestPlanning:
     @pytest.fixture(autouse=True)
@@ -16,6 +21,21 @@ class TestPlanning:
         self.fixture.when_building_planning_problem()
         self.fixture.then_warning_should_be_given(UserWarning, "plans will be empty")
 
+    def test_problem_is_built_once(self):
+        env, _, _, _, _, _, _ = classic_env()
+        self.fixture.given_env(env)
+        self.fixture.when_building_planning_problem()
+        self.fixture.when_building_planning_problem()
+        self.fixture.then_problem_should_be_built_once()
+
+    def test_problem_follows_added_tasks(self):
+        env, _, _, _, _, _, _ = classic_env()
+        self.fixture.given_env(env)
+        self.fixture.when_building_planning_problem()
+        self.fixture.when_adding_task(GetItemTask(Item("wood")))
+        self.fixture.when_building_planning_problem()
+        self.fixture.then_problem_should_have_goals()
+
 
 @pytest.fixture
 def planning_fixture() -> "PlanningFixture":
@@ -28,10 +48,16 @@ class PlanningFixture:
 
     def given_env(self, env: HcraftEnv) -> None:
         self.env = env
+        self.planning_problems: List["HcraftPlanningProblem"] = []
 
     def when_building_planning_problem(self) -> None:
-        with pytest.warns() as self.warning_records:
+        with warnings.catch_warnings(record=True) as self.warning_records:
+            warnings.simplefilter("always")
             self.planning_problem = self.env.planning_problem()
+        self.planning_problems.append(self.planning_problem)
+
+    def when_adding_task(self, task: GetItemTask) -> None:
+        self.env.purpose.add_task(task)
 
     def then_warning_should_be_given(
         self,
@@ -42,6 +68,21 @@ class PlanningFixture:
             warning_records=self.warning_records, warning_type=warning_type, match=match
         ), "Could not find required warning"
 
+    def then_problem_should_be_built_once(self) -> None:
+        first_problem, other_problem = self.planning_problems
+        assert first_problem is not other_problem
+        assert first_problem.upf_problem is not other_problem.upf_problem
+        assert first_problem.upf_problem == other_problem.upf_problem
+        build_warnings = [
+            record
+            for record in self.warning_records
+            if "plans will be empty" in str(record.message)
+        ]
+        assert not build_warnings, "Planning problem was built again"
+
+    def then_problem_should_have_goals(self) -> None:
+        assert self.planning_problem.upf_problem.goals, "Planning goals are missing"
+
 
 def _warning_in_records(
     warning_records: List[warnings.WarningMessage],
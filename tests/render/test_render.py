@@ -1,6 +1,7 @@
+import pytest
 import pytest_check as check
 
-from hcraft.render.render import menus_sizes
+from hcraft.render.render import coalesce_events, menus_sizes
 
 
 class TestMenusSizes:
@@ -66,3 +67,53 @@ class TestMenusSizes:
         check.not_equal(shapes["player"], (0, 0))
         check.not_equal(shapes["zone"], (0, 0))
         check.not_equal(shapes["position"], (0, 0))
+
+
+class TestCoalesceEvents:
+    @pytest.fixture(autouse=True)
+    def setup_method(self):
+        self.pygame = pytest.importorskip("pygame")
+
+    def _event(self, event_type, **kwargs):
+        return self.pygame.event.Event(event_type, **kwargs)
+
+    def test_merge_consecutive_mouse_motions(self):
+        pg = self.pygame
+        first = self._event(pg.MOUSEMOTION, pos=(1, 0), rel=(1, 0), buttons=(0, 0, 0))
+        last = self._event(pg.MOUSEMOTION, pos=(3, 1), rel=(2, 1), buttons=(0, 0, 0))
+        (motion,) = coalesce_events([first, last])
+        check.equal(motion.pos, (3, 1))
+        check.equal(motion.rel, (3, 1))
+
+    def test_keep_mouse_motions_around_clicks(self):
+        pg = self.pygame
+        first = self._event(pg.MOUSEMOTION, pos=(0, 0), rel=(0, 0))
+        click = self._event(pg.MOUSEBUTTONDOWN, button=1, pos=(1, 1))
+        last = self._event(pg.MOUSEMOTION, pos=(2, 2), rel=(2, 2))
+        events = [first, click, last]
+        check.equal(coalesce_events(events), events)
+
+    def test_keep_repeated_clicks(self):
+        pg = self.pygame
+        down = self._event(pg.MOUSEBUTTONDOWN, button=1, pos=(1, 1))
+        up = self._event(pg.MOUSEBUTTONUP, button=1, pos=(1, 1))
+        events = [down, up, down, up]
+        check.equal(coalesce_events(events), events)
+
+    def test_keep_click_order(self):
+        pg = self.pygame
+        down = self._event(pg.MOUSEBUTTONDOWN, button=1, pos=(1, 1))
+        up = self._event(pg.MOUSEBUTTONUP, button=1, pos=(1, 1))
+        other_down = self._event(pg.MOUSEBUTTONDOWN, button=3, pos=(1, 1))
+        events = [down, other_down, up]
+        check.equal(coalesce_events(events), events)
+
+    def test_drop_key_repeats(self):
+        pg = self.pygame
+        down = self._event(pg.KEYDOWN, key=pg.K_a)
+        repeat = self._event(pg.KEYDOWN, key=pg.K_a)
+        up = self._event(pg.KEYUP, key=pg.K_a)
+        down_again = self._event(pg.KEYDOWN, key=pg.K_a)
+        check.equal(
+            coalesce_events([down, repeat, up, down_again]), [down, up, down_again]
+        )
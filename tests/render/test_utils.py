@@ -0,0 +1,76 @@
+from pathlib import Path
+
+import numpy as np
+import pytest
+import pytest_check as check
+
+import hcraft.examples.treasure as treasure
+from hcraft.elements import Item
+from hcraft.examples.treasure import TreasureEnv
+from hcraft.render.utils import (
+    create_text_image,
+    _decode_image,
+    _load_scaled_image,
+    load_image,
+    surface_to_rgb_array,
+)
+
+
+class TestSurfaceToRgbArray:
+    @pytest.fixture(autouse=True)
+    def setup_method(self):
+        self.pygame = pytest.importorskip("pygame")
+        self.surface = self.pygame.Surface((4, 3))
+        self.surface.fill((10, 20, 30))
+        self.surface.set_at((1, 2), (200, 100, 50))
+
+    def test_rgb_array_shape_and_content(self):
+        rgb_array = surface_to_rgb_array(self.surface)
+        expected = self.pygame.surfarray.array3d(self.surface).swapaxes(0, 1)
+        check.equal(rgb_array.shape, (3, 4, 3))
+        check.is_true(np.array_equal(rgb_array, expected))
+        check.is_true(rgb_array.flags["C_CONTIGUOUS"])
+        check.equal(tuple(rgb_array[2, 1]), (200, 100, 50))
+
+    def test_rgb_array_other_channels_order(self):
+        surface = self.pygame.Surface((4, 3), 0, 32, (0xFF, 0xFF00, 0xFF0000, 0))
+        surface.fill((10, 20, 30))
+        surface.set_at((1, 2), (200, 100, 50))
+        rgb_array = surface_to_rgb_array(surface)
+        check.equal(tuple(rgb_array[0, 0]), (10, 20, 30))
+        check.equal(tuple(rgb_array[2, 1]), (200, 100, 50))
+
+    def test_copy_unlocks_surface(self):
+        surface_to_rgb_array(self.surface)
+        check.is_false(self.surface.get_locked())
+
+
+class TestLoadImage:
+    @pytest.fixture(autouse=True)
+    def setup_method(self):
+        self.resources_path = Path(treasure.__file__).parent / "resources"
+
+    def test_only_loaded_images_are_decoded_once(self):
+        _decode_image.cache_clear()
+        _load_scaled_image.cache_clear()
+        load_image(self.resources_path, TreasureEnv.KEY)
+        load_image(self.resources_path, TreasureEnv.KEY)
+        cache_info = _decode_image.cache_info()
+        check.equal(cache_info.currsize, 1)
+        check.equal(cache_info.misses, 1)
+
+    def test_loaded_images_are_copies(self):
+        image = load_image(self.resources_path, TreasureEnv.KEY)
+        check.is_not_none(image)
+        image.paste((0, 0, 0, 0), (0, 0, image.width, image.height))
+        reloaded_image = load_image(self.resources_path, TreasureEnv.KEY)
+        check.not_equal(image.tobytes(), reloaded_image.tobytes())
+
+    def test_missing_image(self):
+        check.is_none(load_image(self.resources_path, Item("unknown")))
+
+    def test_text_images_are_copies(self):
+        image = create_text_image("->", self.resources_path)
+        reloaded_image = create_text_image("->", self.resources_path)
+        check.is_false(image is reloaded_image)
+        check.equal(image.tobytes(), reloaded_image.tobytes())
@@ -0,0 +1,13 @@
+import networkx as nx
+import pytest_check as check
+
+from hcraft.examples import MineHcraftEnv
+
+
+def test_ancestors_match_networkx():
+    requirements = MineHcraftEnv().world.requirements
+    acydigraph = requirements.acydigraph
+    expected_ancestors = {
+        node: nx.ancestors(acydigraph, node) for node in acydigraph.nodes()
+    }
+    check.equal(requirements.ancestors, expected_ancestors)
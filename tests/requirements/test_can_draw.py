@@ -1,11 +1,9 @@
 from pathlib import Path
-from typing import TYPE_CHECKING, Type
+from typing import TYPE_CHECKING
 
 import pytest
-from pytest_mock import MockerFixture
+import pytest_check as check
 
-
-from hcraft.examples import EXAMPLE_ENVS
 from hcraft.env import HcraftEnv
 
 if TYPE_CHECKING:
@@ -13,39 +11,17 @@ if TYPE_CHECKING:
 
 
 @pytest.mark.slow
-@pytest.mark.parametrize("env_class", EXAMPLE_ENVS)
-def test_can_draw(env_class: Type[HcraftEnv], mocker: MockerFixture):
-    draw_plt = True
-    draw_html = True
-    save = False
-    env = env_class()
-    requirements = env.world.requirements
-    requirements_dir = Path("docs", "images", "requirements_graphs")
-
-    if draw_plt:
-        plt: "matplotlib.pyplot" = pytest.importorskip("matplotlib.pyplot")
-
-        width = max(requirements.depth, 10)
-        height = max(9 / 16 * width, requirements.width / requirements.depth * width)
-        resolution = max(64 * requirements.depth, 900)
-        dpi = resolution / width
-
-        fig, ax = plt.subplots()
-        plt.tight_layout()
-        fig.set_size_inches(width, height)
-
-        save_path = None
-        if save:
-            save_path = requirements_dir / f"{env.name}.png"
-        requirements.draw(ax, save_path=save_path, dpi=dpi)
-
-        plt.close()
-
-    if draw_html:
-        pytest.importorskip("pyvis")
-        mocker.patch("pyvis.network.webbrowser.open")
-        requirements_dir.mkdir(exist_ok=True)
-        filepath = requirements_dir / f"{env.name}.html"
-        if not save:
-            mocker.patch("pyvis.network.Network.write_html")
-        requirements.draw(engine="pyvis", save_path=filepath, with_web_uri=True)
+def test_can_draw(example_env: HcraftEnv, monkeypatch: pytest.MonkeyPatch):
+    requirements = example_env.world.requirements
+    check.is_true(len(requirements.graph) > 0)
+
+    plt: "matplotlib.pyplot" = pytest.importorskip("matplotlib.pyplot")
+    _fig, ax = plt.subplots()
+    requirements.draw(ax)
+    plt.close()
+
+    pytest.importorskip("pyvis")
+    monkeypatch.setattr("pyvis.network.webbrowser.open", lambda *args: None)
+    monkeypatch.setattr("pyvis.network.Network.write_html", lambda *args: None)
+    filepath = Path("docs", "images", "requirements_graphs", f"{example_env.name}.html")
+    requirements.draw(engine="pyvis", save_path=filepath, with_web_uri=True)
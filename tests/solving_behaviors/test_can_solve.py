@@ -1,4 +1,3 @@
-from matplotlib import pyplot as plt
 import pytest
 import pytest_check as check
 
@@ -17,12 +16,15 @@ def test_can_solve(env_class):
     draw_call_graph = False
 
     if draw_call_graph:
+        from matplotlib import pyplot as plt
+
         _fig, ax = plt.subplots()
 
     done = False
     observation = env.reset()
     for task in env.purpose.best_terminal_group.tasks:
         solving_behavior = env.solving_behavior(task)
+        seen_states = {env.state.hashable}
         task_done = task.terminated
         while not task_done and not done:
             action = solving_behavior(observation)
@@ -33,8 +35,11 @@ def test_can_solve(env_class):
 
             if action == "Impossible":
                 raise ValueError("Solving behavior could not find a solution.")
-            observation, _reward, done, _ = env.step(action)
-            task_done = task.terminated
+            observation, _reward, done, info = env.step(action)
+            task_done = info[f"{task.name} is done"]
+            if not task_done and env.state.hashable in seen_states:
+                pytest.fail(f"Solving behavior got stuck in a cycle on {task}")
+            seen_states.add(env.state.hashable)
 
     if draw_call_graph:
         plt.show()
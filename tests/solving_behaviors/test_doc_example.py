@@ -1,4 +1,3 @@
-from matplotlib import pyplot as plt
 import pytest
 import pytest_check as check
 
@@ -13,6 +12,8 @@ def test_doc_example():
     render = False
 
     if draw_call_graph:
+        from matplotlib import pyplot as plt
+
         _fig, ax = plt.subplots()
 
     get_diamond = GetItemTask(DIAMOND)
@@ -1,8 +1,8 @@
-from matplotlib import pyplot as plt
 from hcraft.examples.minecraft.env import MineHcraftEnv
 from hcraft.task import Task
 
 
+import numpy as np
 import pytest
 import pytest_check as check
 
@@ -20,6 +20,8 @@ def test_solving_behaviors():
     draw_call_graph = False
 
     if draw_call_graph:
+        from matplotlib import pyplot as plt
+
         _fig, ax = plt.subplots()
 
     env = MineHcraftEnv(purpose="all", max_step=500)
@@ -56,3 +58,29 @@ def test_solving_behaviors():
     if set(t.name for t in tasks_left) == set(HARD_TASKS):
         pytest.xfail(f"Harder tasks ({HARD_TASKS}) cannot be done for now ...")
     check.is_true(env.purpose.terminated, msg=f"tasks not completed: {tasks_left}")
+
+
+def test_solving_behavior_reuses_last_action(mocker):
+    """Asking again for the same observation should not traverse the graph again."""
+    env = MineHcraftEnv(purpose="all")
+    observation = env.reset()
+    task = [t for t in env.purpose.tasks if t.name == "Get wood_plank"][0]
+    solving_behavior = env.solving_behavior(task)
+    action = solving_behavior(observation)
+    graph_call = mocker.spy(solving_behavior.graph, "__call__")
+    check.equal(solving_behavior(observation.copy()), action)
+    check.equal(graph_call.call_count, 0)
+
+
+def test_solving_behavior_last_action_follows_hidden_state(mocker):
+    """A change of state outside the observation should traverse the graph again."""
+    env = MineHcraftEnv(purpose="all")
+    observation = env.reset()
+    task = [t for t in env.purpose.tasks if t.name == "Get wood_plank"][0]
+    solving_behavior = env.solving_behavior(task)
+    solving_behavior(observation)
+    graph_call = mocker.spy(solving_behavior.graph, "__call__")
+    other_zone_slot = int(np.flatnonzero(env.state.position == 0)[0])
+    env.state.zones_inventories[other_zone_slot, 0] += 1
+    solving_behavior(observation.copy())
+    check.equal(graph_call.call_count, 1)
@@ -1,14 +1,10 @@
-from hcraft.examples import EXAMPLE_ENVS
-from hcraft.render.human import render_env_with_human
-
-
 import pytest
+import pytest_check as check
+
+from hcraft.env import HcraftEnv
 
 
 @pytest.mark.slow
-@pytest.mark.parametrize("env_class", EXAMPLE_ENVS)
-def test_build_env(env_class):
-    human_run = False
-    env = env_class()
-    if human_run:
-        render_env_with_human(env)
+def test_build_env(example_env: HcraftEnv):
+    observation = example_env.reset()
+    check.equal(observation.shape, example_env.observation_space.shape)
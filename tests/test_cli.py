@@ -38,8 +38,8 @@ def test_purposed_minehcraft_cli():
     task_names = set(task.name for task in env.purpose.tasks)
     check.equal(task_names, {"Get diamond", "Get wood"})
 
-    for task in env.purpose.tasks:
-        check.equal(task._reward, 100)
+    tasks_rewards = set(task._reward for task in env.purpose.tasks)
+    check.equal(tasks_rewards, {100})
 
 
 @pytest.mark.parametrize("env_name", ENV_NAMES)
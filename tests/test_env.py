@@ -1,15 +1,22 @@
 from pathlib import Path
-from typing import List
+from typing import List, Type
 
 import numpy as np
 import pytest
 import pytest_check as check
-from pytest_mock import MockerFixture
 
 from hcraft.elements import Item, Stack, Zone
 from hcraft.env import HcraftEnv
+from hcraft.examples import MINICRAFT_ENVS, MineHcraftEnv
 from hcraft.task import GetItemTask
-from hcraft.transformation import Transformation, Use, Yield, PLAYER, CURRENT_ZONE
+from hcraft.transformation import (
+    CURRENT_ZONE,
+    PLAYER,
+    Transformation,
+    TransformationsTable,
+    Use,
+    Yield,
+)
 from hcraft.world import world_from_transformations
 from tests.custom_checks import check_np_equal
 from tests.envs import classic_env, player_only_env, zone_only_env
@@ -243,6 +250,27 @@ class TestCreatingEnv:
         check_np_equal(self.env.action_masks(), np.array([1, 1, 1, 1, 0, 0]))
         check_np_equal(infos["action_is_legal"], np.array([1, 1, 1, 1, 0, 0]))
 
+    def test_actions_mask_follow_state_changes(self):
+        wood_slot = self.env.world.items.index(Item("wood"))
+        check_np_equal(self.env.action_masks(), np.array([1, 1, 1, 0, 0, 0]))
+        self.env.state.player_inventory[wood_slot] = 1
+        check_np_equal(self.env.action_masks(), np.array([1, 1, 1, 1, 0, 0]))
+        self.env.state.player_inventory[wood_slot] = 0
+        check_np_equal(self.env.action_masks(), np.array([1, 1, 1, 0, 0, 0]))
+
+    def test_step_only_checks_action_without_memoized_mask(self, mocker):
+        """step should not compute the whole mask of an unseen state."""
+        self.env._action_masks_cache.clear()
+        valid_mask = mocker.spy(TransformationsTable, "valid_mask")
+        wood_slot = self.env.world.items.index(Item("wood"))
+        action = self.transformations.index(
+            self.named_transformations.get("search_wood")
+        )
+        self.env.step(action)
+        check.equal(self.env.state.player_inventory[wood_slot], 1)
+        # Only once for the step infos of the new state
+        check.equal(valid_mask.call_count, 1)
+
     def test_max_step(self):
         """max_step should truncate the episode after desired number of steps."""
         env = HcraftEnv(self.world, max_step=3)
@@ -258,6 +286,20 @@ class TestCreatingEnv:
         check.is_true(env.truncated)
 
 
+@pytest.mark.parametrize("env_class", [MineHcraftEnv, *MINICRAFT_ENVS])
+def test_actions_mask_matches_transformations_validity(env_class: Type[HcraftEnv]):
+    """Stacked action masks should agree with each transformation own validity."""
+    env = env_class(max_step=50)
+    env.reset()
+    rng = np.random.default_rng(42)
+    done = False
+    while not done:
+        expected = [t.is_valid(env.state) for t in env.world.transformations]
+        action_masks = env.action_masks()
+        check.is_true(np.array_equal(action_masks, expected))
+        _, _, done, _ = env.step(int(rng.choice(np.flatnonzero(action_masks))))
+
+
 def test_discovered_items():
     """items should be discovered if they have been obtained anytime in this episode."""
     env, _, named_transformations = player_only_env()[:3]
@@ -376,7 +418,7 @@ def test_observation_one_zone_no_player_items():
 
 
 @pytest.mark.slow
-def test_treasure_env(mocker: MockerFixture):
+def test_treasure_env(monkeypatch: pytest.MonkeyPatch):
     """Ensure that the example for the documentation is working properly."""
     pytest.importorskip("pygame")
     pytest.importorskip("pygame_menu")
@@ -386,7 +428,7 @@ def test_treasure_env(mocker: MockerFixture):
     def fake_human_action(*args, **kwargs):
         return HUMAN_ACTIONS.pop(0)
 
-    mocker.patch("hcraft.render.human.get_human_action", fake_human_action)
+    monkeypatch.setattr("hcraft.render.human.get_human_action", fake_human_action)
 
     from hcraft.elements import Item
 
@@ -487,14 +529,14 @@ def test_treasure_env(mocker: MockerFixture):
 
 
 @pytest.mark.slow
-def test_class_tresure_env(mocker: MockerFixture):
+def test_class_tresure_env(monkeypatch: pytest.MonkeyPatch):
     pytest.importorskip("pygame")
     pytest.importorskip("pygame_menu")
 
     def fake_human_action(*args, **kwargs):
         return 0
 
-    mocker.patch("hcraft.render.human.get_human_action", fake_human_action)
+    monkeypatch.setattr("hcraft.render.human.get_human_action", fake_human_action)
 
     from hcraft.examples.treasure import TreasureEnv
     from hcraft.render.human import render_env_with_human
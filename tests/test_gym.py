@@ -1,6 +1,9 @@
+import subprocess
+import sys
 from typing import TYPE_CHECKING
 
 import pytest
+import pytest_check as check
 
 from hcraft.examples import HCRAFT_GYM_ENVS
 
@@ -9,7 +12,24 @@ if TYPE_CHECKING:
 
 
 @pytest.mark.slow
-@pytest.mark.parametrize("env_gym_id", HCRAFT_GYM_ENVS)
+@pytest.mark.parametrize("env_gym_id", sorted(HCRAFT_GYM_ENVS))
 def test_gym_make(env_gym_id):
     gym: "gym" = pytest.importorskip("gym")
     gym.make(env_gym_id)
+
+
+def test_register_gym_envs():
+    gym: "gym" = pytest.importorskip("gym")
+    from hcraft import register_gym_envs
+
+    missing_env_ids = set(register_gym_envs()) - set(gym.envs.registry)
+    check.is_false(missing_env_ids, msg=f"Missing gym envs: {missing_env_ids}")
+
+
+@pytest.mark.slow
+def test_gym_make_after_importing_hcraft():
+    """Importing hcraft alone should be enough to make its gym environments."""
+    pytest.importorskip("gym")
+    code = "import gym, hcraft; gym.make('MineHcraft-NoReward-v1')"
+    process = subprocess.run([sys.executable, "-c", code], capture_output=True)
+    check.equal(process.returncode, 0, msg=process.stderr.decode())
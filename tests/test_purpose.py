@@ -1,6 +1,7 @@
 from dataclasses import dataclass
 from typing import Any, List, Tuple
 
+import numpy as np
 import pytest
 import pytest_check as check
 
@@ -17,6 +18,7 @@ from hcraft.transformation import (
     DESTINATION,
 )
 from hcraft.world import World, world_from_transformations
+from tests.envs import classic_env
 
 
 @dataclass
@@ -47,6 +49,14 @@ class TestNoPurpose:
         purpose = Purpose(None, timestep_reward=-1)
         check.equal(purpose.reward(self.state), -1)
 
+    def test_build_once(self):
+        env = HcraftEnv(World([], [], [], []), purpose=self.purpose)
+        env.reset()
+        check.is_true(self.purpose.built)
+        task_successes = env.task_successes
+        env.reset()
+        check.is_true(env.task_successes is task_successes)
+
 
 class DummyPosEqualTask(Task):
     def __init__(self, reward, goal_position) -> None:
@@ -56,12 +66,12 @@ class DummyPosEqualTask(Task):
         super().__init__(name=f"Go to {goal_position}")
 
     def reward(self, state: DummyState) -> float:
-        if state.position == self.goal_position:
+        if self._is_terminal(state):
             return self._reward
         return 0.0
 
     def _is_terminal(self, state: DummyState) -> bool:
-        return state.position == self.goal_position
+        return np.array_equal(state.position, self.goal_position)
 
     def build(self, world: World) -> None:
         self.is_built = True
@@ -129,6 +139,25 @@ class TestPurposeMultiTasks:
     def test_is_not_terminal_by_3(self):
         check.is_false(self.purpose.is_terminal(DummyState.from_pos(3)))  # Task 3 ends
 
+    def test_is_terminal_until_reset(self):
+        self.purpose.build(self.env)
+        self.purpose.is_terminal(DummyState.from_pos(1))  # Task 1 ends
+        check.is_false(self.purpose.terminated)
+        check.is_true(self.purpose.is_terminal(DummyState.from_pos(2)))  # Task 2 ends
+        check.is_true(self.purpose.terminated)
+        check.is_true(self.purpose.is_terminal(DummyState.from_pos(-1)))
+        self.purpose.reset()
+        check.is_false(self.purpose.terminated)
+        check.is_false(self.purpose.is_terminal(DummyState.from_pos(2)))  # Task 2 ends
+
+    def test_terminated_follows_tasks_reset_outside_purpose(self):
+        self.purpose.build(self.env)
+        self.purpose.is_terminal(DummyState.from_pos(1))  # Task 1 ends
+        check.is_true(self.purpose.is_terminal(DummyState.from_pos(2)))  # Task 2 ends
+        self.go_to_2.reset()
+        check.is_false(self.purpose.terminated)
+        check.is_false(self.purpose.is_terminal(DummyState.from_pos(3)))
+
     def test_add_task_with_default_reward_shaping(self):
         purpose = Purpose()
         purpose.add_task(self.go_to_0)
@@ -161,78 +190,162 @@ class TestPurposeMultiTasks:
         check.equal(str(Purpose()), "Purpose()")
 
 
-class TestPurposeRewardShaping:
-    @pytest.fixture(autouse=True)
-    def setup_method(self):
-        self.zones = [Zone(str(i)) for i in range(5)]
-        self.items = [Item(str(i)) for i in range(4)]
-
-        go_to_zones = []
-        for zone in self.zones[:4]:
-            go_to_zones.append(Transformation(destination=zone))
-
-        for from_zone in self.zones[:2]:
-            go_to_zones.append(
-                Transformation(
-                    destination=self.zones[4],
-                    inventory_changes=[
-                        Use(PLAYER, self.items[0], consume=1),
-                        Use(CURRENT_ZONE, self.items[0], consume=1),
-                        Use(DESTINATION, self.items[2], consume=1),
-                    ],
-                    zone=from_zone,
-                )
-            )
-
-        # Item 0
-        search_0 = Transformation(
-            inventory_changes=[Yield(PLAYER, self.items[0])],
-            zone=self.zones[0],
-        )
-        # Item 0 > Item 1
-        craft_1 = Transformation(
-            inventory_changes=[
-                Use(PLAYER, self.items[0], consume=1),
-                Yield(PLAYER, self.items[1], create=1),
-            ],
-        )
-        # Item 1 > Item 2
-        craft_2 = Transformation(
-            inventory_changes=[
-                Use(PLAYER, self.items[1], consume=1),
-                Yield(PLAYER, self.items[2], create=1),
-            ],
-            zone=self.zones[1],
-        )
-        # Item 2 > 2 * Item 2
-        craft_2_with_2 = Transformation(
-            inventory_changes=[
-                Use(PLAYER, self.items[2], consume=1),
-                Yield(PLAYER, self.items[2], create=2),
-            ],
+class TestPurposeBuiltRewards:
+    def test_rewards_match_tasks_rewards(self):
+        """Built purpose rewards and terminations should match its tasks ones."""
+        env, _, named_transformations, start_zone, _, zones, _ = classic_env()
+        purpose = Purpose(
+            [
+                GetItemTask(Item("plank"), reward=2),
+                GoToZoneTask(start_zone, reward=3),
+                GoToZoneTask(zones[1], reward=5),
+                PlaceItemTask(Item("table"), reward=7),
+            ]
         )
-        # Item 3
-        search_3 = Transformation(
-            inventory_changes=[Yield(PLAYER, self.items[3], create=1)],
-            zone=self.zones[2],
+        purpose.build(env)
+        env.reset()
+        for name in (
+            "search_wood",
+            "craft_plank",
+            "move_to_other_zone",
+            "craft_table",
+        ):
+            transformation = named_transformations[name]
+            env.step(env.world.slot_from_transformation(transformation))
+            expected_reward = sum(task.reward(env.state) for task in purpose.tasks)
+            check.equal(purpose.reward(env.state), expected_reward)
+            purpose.is_terminal(env.state)
+        check.is_true(purpose.terminated)
+        check.equal([task for task in purpose.tasks if not task.terminated], [])
+
+    def test_task_added_after_build_is_rewarded(self):
+        env, _, named_transformations, start_zone, _, _, _ = classic_env()
+        purpose = Purpose(GoToZoneTask(start_zone, reward=3))
+        purpose.build(env)
+        plank_task = GetItemTask(Item("plank"), reward=2)
+        purpose.add_task(plank_task)
+        check.is_true(purpose.built)
+        env.reset()
+        for name in ("search_wood", "craft_plank"):
+            transformation = named_transformations[name]
+            env.step(env.world.slot_from_transformation(transformation))
+        expected_reward = sum(task.reward(env.state) for task in purpose.tasks)
+        check.equal(purpose.reward(env.state), expected_reward)
+        purpose.is_terminal(env.state)
+        check.is_true(plank_task.terminated)
+
+    def test_task_reset_outside_purpose_is_rewarded_once(self):
+        env, _, named_transformations, _, _, zones, _ = classic_env()
+        plank_task = GetItemTask(Item("plank"), reward=2)
+        purpose = Purpose([plank_task, GoToZoneTask(zones[1], reward=3)])
+        purpose.build(env)
+        env.reset()
+        for name in ("search_wood", "craft_plank"):
+            transformation = named_transformations[name]
+            env.step(env.world.slot_from_transformation(transformation))
+        purpose.is_terminal(env.state)
+        plank_task.reset()
+        check.equal(purpose.reward(env.state), 2)
+        purpose.is_terminal(env.state)
+        check.equal(purpose.reward(env.state), 0)
+
+
+@pytest.fixture(scope="class")
+def shaping_world() -> Tuple[List[Zone], List[Item], HcraftEnv]:
+    zones = [Zone(str(i)) for i in range(5)]
+    items = [Item(str(i)) for i in range(4)]
+
+    go_to_zones = []
+    for zone in zones[:4]:
+        go_to_zones.append(Transformation(destination=zone))
+
+    for from_zone in zones[:2]:
+        go_to_zones.append(
+            Transformation(
+                destination=zones[4],
+                inventory_changes=[
+                    Use(PLAYER, items[0], consume=1),
+                    Use(CURRENT_ZONE, items[0], consume=1),
+                    Use(DESTINATION, items[2], consume=1),
+                ],
+                zone=from_zone,
+            )
         )
 
-        # Zone Item 0
-        place_0 = Transformation(
-            inventory_changes=[
-                Use(PLAYER, self.items[0], consume=1),
-                Yield(CURRENT_ZONE, self.items[0], create=1),
-            ],
+    # Item 0
+    search_0 = Transformation(
+        inventory_changes=[Yield(PLAYER, items[0])],
+        zone=zones[0],
+    )
+    # Item 0 > Item 1
+    craft_1 = Transformation(
+        inventory_changes=[
+            Use(PLAYER, items[0], consume=1),
+            Yield(PLAYER, items[1], create=1),
+        ],
+    )
+    # Item 1 > Item 2
+    craft_2 = Transformation(
+        inventory_changes=[
+            Use(PLAYER, items[1], consume=1),
+            Yield(PLAYER, items[2], create=1),
+        ],
+        zone=zones[1],
+    )
+    # Item 2 > 2 * Item 2
+    craft_2_with_2 = Transformation(
+        inventory_changes=[
+            Use(PLAYER, items[2], consume=1),
+            Yield(PLAYER, items[2], create=2),
+        ],
+    )
+    # Item 3
+    search_3 = Transformation(
+        inventory_changes=[Yield(PLAYER, items[3], create=1)],
+        zone=zones[2],
+    )
+
+    # Zone Item 0
+    place_0 = Transformation(
+        inventory_changes=[
+            Use(PLAYER, items[0], consume=1),
+            Yield(CURRENT_ZONE, items[0], create=1),
+        ],
+    )
+
+    # Zone Item 2
+    place_2 = Transformation(
+        inventory_changes=[
+            Use(PLAYER, items[2], consume=1),
+            Use(CURRENT_ZONE, items[0], consume=1),
+            Yield(CURRENT_ZONE, items[2], create=1),
+        ],
+    )
+
+    transformations = [
+        search_0,
+        craft_1,
+        craft_2,
+        craft_2_with_2,
+        search_3,
+        place_0,
+        place_2,
+        *go_to_zones,
+    ]
+    env = HcraftEnv(
+        world_from_transformations(
+            transformations,
+            start_zones_items={zones[4]: [Stack(items[2], 2)]},
         )
+    )
+    return zones, items, env
 
-        # Zone Item 2
-        place_2 = Transformation(
-            inventory_changes=[
-                Use(PLAYER, self.items[2], consume=1),
-                Use(CURRENT_ZONE, self.items[0], consume=1),
-                Yield(CURRENT_ZONE, self.items[2], create=1),
-            ],
-        )
+
+class TestPurposeRewardShaping:
+    @pytest.fixture(autouse=True)
+    def setup_method(self, shaping_world: Tuple[List[Zone], List[Item], HcraftEnv]):
+        self.zones, self.items, self.env = shaping_world
+        self.zone_items = self.env.world.zones_items
 
         self.get_item_2 = GetItemTask(self.items[2], reward=10.0)
         self.place_item_2_in_zone_0 = PlaceItemTask(
@@ -241,24 +354,6 @@ class TestPurposeRewardShaping:
 
         self.go_to_4 = GoToZoneTask(self.zones[4], reward=10.0)
 
-        transformations = [
-            search_0,
-            craft_1,
-            craft_2,
-            craft_2_with_2,
-            search_3,
-            place_0,
-            place_2,
-            *go_to_zones,
-        ]
-        self.env = HcraftEnv(
-            world_from_transformations(
-                transformations,
-                start_zones_items={self.zones[4]: [Stack(self.items[2], 2)]},
-            )
-        )
-        self.zone_items = self.env.world.zones_items
-
     def test_no_reward_shaping(self):
         purpose = Purpose()
         purpose.add_task(self.get_item_2, RewardShaping.NONE)
@@ -268,119 +363,118 @@ class TestPurposeRewardShaping:
         purpose = Purpose()
         purpose.add_task(self.get_item_2, reward_shaping=RewardShaping.ALL_ACHIVEMENTS)
         purpose.build(self.env)
-        _check_get_item_tasks(self.items, purpose.tasks)
-        _check_go_to_zone_tasks(self.zones, purpose.tasks)
+        _check_get_item_tasks(self.items, purpose)
+        _check_go_to_zone_tasks(self.zones, purpose)
         _check_place_item_tasks(
-            [(zone_item, None) for zone_item in self.zone_items], purpose.tasks
+            [(zone_item, None) for zone_item in self.zone_items], purpose
         )
 
+    def test_shaping_subtasks_are_unique(self):
+        purpose = Purpose(default_reward_shaping=RewardShaping.ALL_ACHIVEMENTS)
+        purpose.add_task(self.get_item_2)
+        purpose.add_task(self.go_to_4)
+        purpose.build(self.env)
+        tasks_names = [task.name for task in purpose.tasks]
+        check.equal(len(tasks_names), len(set(tasks_names)))
+
     def test_shaping_subtasks_are_optional(self):
         purpose = Purpose()
         purpose.add_task(self.get_item_2, reward_shaping=RewardShaping.ALL_ACHIVEMENTS)
         purpose.build(self.env)
         check.equal(purpose.terminal_groups[0].tasks, [self.get_item_2])
 
-    def test_inputs_achivements_shaping(self):
-        purpose = Purpose()
-        purpose.add_task(
-            self.get_item_2,
-            reward_shaping=RewardShaping.INPUTS_ACHIVEMENT,
-        )
-        purpose.build(self.env)
-        _check_get_item_tasks([self.items[1]], purpose.tasks)
-        _check_go_to_zone_tasks([self.zones[1]], purpose.tasks)
-
-    def test_requires_achivements_shaping(self):
-        purpose = Purpose()
-        purpose.add_task(
-            self.get_item_2,
-            reward_shaping=RewardShaping.REQUIREMENTS_ACHIVEMENTS,
-        )
-        purpose.build(self.env)
-        _check_get_item_tasks(self.items[:2], purpose.tasks)
-        _check_go_to_zone_tasks(self.zones[:2], purpose.tasks)
-
-    def test_inputs_achivements_shaping_place_item(self):
+    @pytest.mark.parametrize(
+        "task_attr,reward_shaping,items_ids,zones_ids,zone_items_ids",
+        [
+            pytest.param(
+                "get_item_2",
+                RewardShaping.INPUTS_ACHIVEMENT,
+                [1],
+                [1],
+                [],
+                id="inputs-get_item",
+            ),
+            pytest.param(
+                "get_item_2",
+                RewardShaping.REQUIREMENTS_ACHIVEMENTS,
+                [0, 1],
+                [0, 1],
+                [],
+                id="requirements-get_item",
+            ),
+            pytest.param(
+                "place_item_2_in_zone_0",
+                RewardShaping.INPUTS_ACHIVEMENT,
+                [2],
+                [3],
+                [0],
+                id="inputs-place_item",
+            ),
+            pytest.param(
+                "place_item_2_in_zone_0",
+                RewardShaping.REQUIREMENTS_ACHIVEMENTS,
+                [0, 1, 2],
+                [0, 1, 3],
+                [0],
+                id="requirements-place_item",
+            ),
+            pytest.param(
+                "go_to_4",
+                RewardShaping.INPUTS_ACHIVEMENT,
+                [0],
+                [0, 1],
+                [0, 2],
+                id="inputs-go_to_zone",
+            ),
+            pytest.param(
+                "go_to_4",
+                RewardShaping.REQUIREMENTS_ACHIVEMENTS,
+                [0],
+                [0, 1],
+                [0, 2],
+                id="requirements-go_to_zone",
+            ),
+        ],
+    )
+    def test_achivements_shaping(
+        self,
+        task_attr: str,
+        reward_shaping: RewardShaping,
+        items_ids: List[int],
+        zones_ids: List[int],
+        zone_items_ids: List[int],
+    ):
         purpose = Purpose()
-        purpose.add_task(
-            self.place_item_2_in_zone_0,
-            reward_shaping=RewardShaping.INPUTS_ACHIVEMENT,
-        )
+        purpose.add_task(getattr(self, task_attr), reward_shaping=reward_shaping)
         purpose.build(self.env)
-        _check_get_item_tasks([self.items[2]], purpose.tasks)
-        _check_go_to_zone_tasks([self.zones[3]], purpose.tasks)
-        _check_place_item_tasks([(self.items[0], None)], purpose.tasks)
-
-    def test_requires_achivements_shaping_place_item(self):
-        purpose = Purpose()
-        purpose.add_task(
-            self.place_item_2_in_zone_0,
-            reward_shaping=RewardShaping.REQUIREMENTS_ACHIVEMENTS,
-        )
-        purpose.build(self.env)
-        _check_get_item_tasks(self.items[:3], purpose.tasks)
-        _check_go_to_zone_tasks(self.zones[:2] + [self.zones[3]], purpose.tasks)
-        _check_place_item_tasks([(self.items[0], None)], purpose.tasks)
-
-    def test_inputs_achivements_shaping_go_to_zone(self):
-        purpose = Purpose()
-        purpose.add_task(
-            self.go_to_4,
-            reward_shaping=RewardShaping.INPUTS_ACHIVEMENT,
-        )
-        purpose.build(self.env)
-        _check_get_item_tasks(self.items[:1], purpose.tasks)
-        _check_go_to_zone_tasks(self.zones[:2], purpose.tasks)
+        _check_get_item_tasks([self.items[i] for i in items_ids], purpose)
+        _check_go_to_zone_tasks([self.zones[i] for i in zones_ids], purpose)
         _check_place_item_tasks(
-            [
-                (self.items[0], None),
-                (self.items[2], None),
-            ],
-            purpose.tasks,
-        )
-
-    def test_requires_achivements_shaping_go_to_zone(self):
-        purpose = Purpose()
-        purpose.add_task(
-            self.go_to_4,
-            reward_shaping=RewardShaping.REQUIREMENTS_ACHIVEMENTS,
-        )
-        purpose.build(self.env)
-        _check_get_item_tasks(self.items[:1], purpose.tasks)
-        _check_go_to_zone_tasks(self.zones[:2], purpose.tasks)
-        _check_place_item_tasks(
-            [
-                (self.items[0], None),
-                (self.items[2], None),
-            ],
-            purpose.tasks,
+            [(self.items[i], None) for i in zone_items_ids], purpose
         )
 
 
-def _check_get_item_tasks(items: List[Item], tasks: List[Task]):
+def _check_get_item_tasks(items: List[Item], purpose: Purpose):
     all_items_stacks = [Stack(item) for item in items]
     expected_task_names = [
         GetItemTask.get_name(item_stack) for item_stack in all_items_stacks
     ]
-    _check_in_tasks_names(tasks, expected_task_names)
+    _check_in_tasks_names(purpose, expected_task_names)
 
 
-def _check_go_to_zone_tasks(zones: List[Zone], tasks: List[Task]):
+def _check_go_to_zone_tasks(zones: List[Zone], purpose: Purpose):
     expected_task_names = [GoToZoneTask.get_name(zone) for zone in zones]
-    _check_in_tasks_names(tasks, expected_task_names)
+    _check_in_tasks_names(purpose, expected_task_names)
 
 
-def _check_place_item_tasks(
-    items_and_zones: List[Tuple[Item, Zone]], tasks: List[Task]
-):
+def _check_place_item_tasks(items_and_zones: List[Tuple[Item, Zone]], purpose: Purpose):
     stacks_and_zones = [(Stack(item), zones) for item, zones in items_and_zones]
     expected_task_names = [
         PlaceItemTask.get_name(stack, zones) for stack, zones in stacks_and_zones
     ]
-    _check_in_tasks_names(tasks, expected_task_names)
+    _check_in_tasks_names(purpose, expected_task_names)
 
 
-def _check_in_tasks_names(tasks: List[Task], expected_task_names: List[str]):
-    task_names = [task.name for task in tasks]
-    for task_name in expected_task_names:
-        check.is_in(task_name, task_names)
+def _check_in_tasks_names(purpose: Purpose, expected_task_names: List[str]):
+    missing_task_names = set(expected_task_names) - purpose.task_names
+    check.is_false(missing_task_names, msg=f"Missing tasks: {missing_task_names}")
@@ -1,4 +1,6 @@
+import numpy as np
 import pytest
+import pytest_check as check
 
 from hcraft.env import HcraftEnv
 from hcraft.render.human import render_env_with_human
@@ -27,3 +29,55 @@ def _render_env(env: HcraftEnv, test_with_human: bool = False):
         render_env_with_human(env)
     env.render(render_mode="rgb_array")
     env.close()
+
+
+def test_render_only_dirty_widgets_matches_full_redraw():
+    pytest.importorskip("pygame")
+    pytest.importorskip("pygame_menu")
+    env, *_ = classic_env()
+    env.reset()
+    env.render(render_mode="rgb_array")
+    for action in range(len(env.world.transformations)):
+        env.step(action)
+        env.render(render_mode="rgb_array")
+    incremental = env.render(render_mode="rgb_array")
+
+    env.render_window._background_painted = False
+    full = env.render(render_mode="rgb_array")
+    env.close()
+    check.is_true(np.array_equal(incremental, full))
+
+
+def test_render_rgb_array_returns_new_frames():
+    pytest.importorskip("pygame")
+    pytest.importorskip("pygame_menu")
+    env, *_ = classic_env()
+    env.reset()
+    first_frame = env.render(render_mode="rgb_array")
+    second_frame = env.render(render_mode="rgb_array")
+    env.close()
+    check.is_false(np.shares_memory(first_frame, second_frame))
+
+
+def test_render_window_does_not_block_window_events():
+    pygame = pytest.importorskip("pygame")
+    pytest.importorskip("pygame_menu")
+    env, *_ = classic_env()
+    env.reset()
+    env.render(render_mode="rgb_array")
+    blocked = pygame.event.get_blocked([pygame.WINDOWEXPOSED, pygame.VIDEOEXPOSE])
+    env.close()
+    check.is_false(blocked)
+
+
+def test_render_window_repaints_fully_after_expose(mocker):
+    pygame = pytest.importorskip("pygame")
+    pytest.importorskip("pygame_menu")
+    env, *_ = classic_env()
+    env.reset()
+    env.render(render_mode="rgb_array")
+    display_update = mocker.spy(pygame.display, "update")
+    expose = pygame.event.Event(pygame.WINDOWEXPOSED)
+    env.render_window.update_rendering(additional_events=[expose])
+    env.close()
+    check.equal(display_update.call_args, mocker.call())
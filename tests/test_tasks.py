@@ -18,6 +18,7 @@ class DummyState:
     zones_inventories: Any = None
 
 
+@pytest.fixture(scope="module")
 def simple_world() -> World:
     return World(
         items=[Item("dirt"), Item("wood"), Item("stone"), Item("plank")],
@@ -27,10 +28,30 @@ def simple_world() -> World:
     )
 
 
+def _read_only(values: list) -> np.ndarray:
+    array = np.array(values)
+    array.setflags(write=False)
+    return array
+
+
+# Shared states arrays, read-only so tasks cannot modify them
+NOT_ENOUGH_WOOD = _read_only([10, 2, 10, 10])
+ENOUGH_WOOD = _read_only([0, 3, 0, 0])
+MORE_THAN_ENOUGH_WOOD = _read_only([0, 4, 0, 0])
+
+IN_START = _read_only([1, 0])
+IN_OTHER_ZONE = _read_only([0, 1])
+
+NO_HOUSE_IN_OTHER_ZONE = _read_only([[10, 10, 10], [10, 10, 0]])
+NO_HOUSE_ANYWHERE = _read_only([[10, 10, 0], [10, 10, 0]])
+HOUSES_IN_OTHER_ZONE = _read_only([[0, 0, 0], [0, 0, 2]])
+HOUSES_IN_START = _read_only([[0, 0, 2], [0, 0, 0]])
+
+
 class TestGetItem:
     @pytest.fixture(autouse=True)
-    def setup_method(self):
-        self.world = simple_world()
+    def setup_method(self, simple_world: World):
+        self.world = simple_world
         self.task = GetItemTask(Stack(Item("wood"), 3), reward=5)
 
     def test_build(self):
@@ -48,20 +69,20 @@ class TestGetItem:
         """should terminate only when the player has more than wanted items."""
         self.task.build(self.world)
 
-        state = DummyState(player_inventory=np.array([10, 2, 10, 10]))
+        state = DummyState(player_inventory=NOT_ENOUGH_WOOD)
         check.is_false(self.task.is_terminal(state))
-        state = DummyState(player_inventory=np.array([0, 3, 0, 0]))
+        state = DummyState(player_inventory=ENOUGH_WOOD)
         check.is_true(self.task.is_terminal(state))
-        state = DummyState(player_inventory=np.array([0, 4, 0, 0]))
+        state = DummyState(player_inventory=MORE_THAN_ENOUGH_WOOD)
         check.is_true(self.task.is_terminal(state))
 
     def test_reward(self):
         """should reward only the first time the task terminates."""
         self.task.build(self.world)
 
-        state = DummyState(player_inventory=np.array([10, 2, 10, 10]))
+        state = DummyState(player_inventory=NOT_ENOUGH_WOOD)
         check.equal(self.task.reward(state), 0)
-        state = DummyState(player_inventory=np.array([0, 4, 0, 0]))
+        state = DummyState(player_inventory=MORE_THAN_ENOUGH_WOOD)
         check.equal(self.task.reward(state), 5)
         self.task.terminated = True
         check.equal(self.task.reward(state), 0)
@@ -69,8 +90,8 @@ class TestGetItem:
 
 class TestGoToZone:
     @pytest.fixture(autouse=True)
-    def setup_method(self):
-        self.world = simple_world()
+    def setup_method(self, simple_world: World):
+        self.world = simple_world
         self.task = GoToZoneTask(Zone("other_zone"), reward=5)
 
     def test_build(self):
@@ -82,18 +103,18 @@ class TestGoToZone:
         """should terminate only when the player is in the zone"""
         self.task.build(self.world)
 
-        state = DummyState(position=np.array([1, 0]))
+        state = DummyState(position=IN_START)
         check.is_false(self.task.is_terminal(state))
-        state = DummyState(position=np.array([0, 1]))
+        state = DummyState(position=IN_OTHER_ZONE)
         check.is_true(self.task.is_terminal(state))
 
     def test_reward(self):
         """should reward only the first time the task terminates."""
         self.task.build(self.world)
 
-        state = DummyState(position=np.array([1, 0]))
+        state = DummyState(position=IN_START)
         check.equal(self.task.reward(state), 0)
-        state = DummyState(position=np.array([0, 1]))
+        state = DummyState(position=IN_OTHER_ZONE)
         check.equal(self.task.reward(state), 5)
         self.task.terminated = True
         check.equal(self.task.reward(state), 0)
@@ -101,8 +122,8 @@ class TestGoToZone:
 
 class TestPlaceItem:
     @pytest.fixture(autouse=True)
-    def setup_method(self):
-        self.world = simple_world()
+    def setup_method(self, simple_world: World):
+        self.world = simple_world
         self.task = PlaceItemTask(
             Stack(Item("wood_house"), 2), Zone("other_zone"), reward=5
         )
@@ -131,9 +152,9 @@ class TestPlaceItem:
         """should terminate only when the given zone has more than wanted items."""
         self.task.build(self.world)
 
-        state = DummyState(zones_inventories=np.array([[10, 10, 10], [10, 10, 0]]))
+        state = DummyState(zones_inventories=NO_HOUSE_IN_OTHER_ZONE)
         check.is_false(self.task.is_terminal(state))
-        state = DummyState(zones_inventories=np.array([[0, 0, 0], [0, 0, 2]]))
+        state = DummyState(zones_inventories=HOUSES_IN_OTHER_ZONE)
         check.is_true(self.task.is_terminal(state))
 
     def test_terminate_any_zone(self):
@@ -141,20 +162,20 @@ class TestPlaceItem:
         task = PlaceItemTask(Stack(Item("wood_house"), 2), reward=5)
         task.build(self.world)
 
-        state = DummyState(zones_inventories=np.array([[10, 10, 0], [10, 10, 0]]))
+        state = DummyState(zones_inventories=NO_HOUSE_ANYWHERE)
         check.is_false(task.is_terminal(state))
-        state = DummyState(zones_inventories=np.array([[0, 0, 0], [0, 0, 2]]))
+        state = DummyState(zones_inventories=HOUSES_IN_OTHER_ZONE)
         check.is_true(task.is_terminal(state))
-        state = DummyState(zones_inventories=np.array([[0, 0, 2], [0, 0, 0]]))
+        state = DummyState(zones_inventories=HOUSES_IN_START)
         check.is_true(task.is_terminal(state))
 
     def test_reward(self):
         """should reward only the first time the task terminates."""
         self.task.build(self.world)
 
-        state = DummyState(zones_inventories=np.array([[10, 10, 10], [10, 10, 0]]))
+        state = DummyState(zones_inventories=NO_HOUSE_IN_OTHER_ZONE)
         check.equal(self.task.reward(state), 0)
-        state = DummyState(zones_inventories=np.array([[0, 0, 0], [0, 0, 2]]))
+        state = DummyState(zones_inventories=HOUSES_IN_OTHER_ZONE)
         check.equal(self.task.reward(state), 5)
         self.task.terminated = True
         check.equal(self.task.reward(state), 0)
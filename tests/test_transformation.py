@@ -7,6 +7,7 @@ import pytest_check as check
 from hcraft.elements import Item, Stack, Zone
 from hcraft.transformation import (
     Transformation,
+    TransformationsTable,
     Use,
     Yield,
     PLAYER,
@@ -192,6 +193,65 @@ class TestTransformationIsValid:
                 msg=f"{state}, {transfo.is_valid(state)}|{expected_valid}",
             )
 
+    def test_valid_mask_matches_is_valid(self):
+        transformations = [
+            Transformation(destination=self.zones[0], zone=self.zones[2]),
+            Transformation(
+                inventory_changes=[
+                    Use(PLAYER, self.items[0], consume=1),
+                    Yield(PLAYER, self.items[1], max=2),
+                ],
+            ),
+            Transformation(
+                inventory_changes=[
+                    Use(CURRENT_ZONE, self.zones_items[0], consume=3, min=1),
+                    Yield(CURRENT_ZONE, self.zones_items[1], max=0),
+                ],
+            ),
+            Transformation(
+                destination=self.zones[1],
+                inventory_changes=[
+                    Use(DESTINATION, self.zones_items[0], consume=1),
+                    Yield(DESTINATION, self.zones_items[1], max=0),
+                ],
+            ),
+            Transformation(
+                inventory_changes=[
+                    Use(self.zones[1], self.zones_items[0], consume=1),
+                    Yield(self.zones[1], self.zones_items[1], max=0),
+                ],
+            ),
+        ]
+        for transfo in transformations:
+            transfo.build(self.world)
+        table = TransformationsTable(transformations, self.world)
+
+        player_inventory = np.array([1, 1, 0])
+        zones_inventories_examples = [
+            np.array([[1, 0], [1, 0], [0, 0]]),
+            np.array([[1, 0], [0, 1], [1, 0]]),
+            np.array([[0, 1], [1, 0], [1, 0]]),
+        ]
+        positions = [
+            np.array([0, 1, 0]),  # One-hot
+            np.array([1, 1, 0]),  # Multiple zones
+            np.array([0, 1, 1]),  # Multiple zones
+            np.array([0, 0, 0]),  # Nowhere
+        ]
+        for zones_inventories in zones_inventories_examples:
+            for position in positions:
+                state = DummyState(
+                    player_inventory=player_inventory,
+                    position=position,
+                    zones_inventories=zones_inventories,
+                )
+                expected_mask = [transfo.is_valid(state) for transfo in transformations]
+                check.equal(
+                    table.valid_mask(state).tolist(),
+                    expected_mask,
+                    msg=f"{state}",
+                )
+
     def test_destination_op(self):
         transfo = Transformation(destination=self.zones[1])
         transfo.build(self.world)
@@ -2,6 +2,7 @@ import pytest
 import pytest_check as check
 
 from hcraft.elements import Item, Zone
+from hcraft.transformation import PLAYER, Transformation, Use, Yield
 from hcraft.world import World
 
 
@@ -16,7 +17,12 @@ class TestWorld:
         self.items = [Item(str(i)) for i in range(self.n_items)]
         self.zones = [Zone(str(i)) for i in range(self.n_zones)]
         self.zones_items = [Item(f"z{i}") for i in range(self.n_zones_items)]
-        self.world = World(self.items, self.zones, self.zones_items)
+        self.transformations = [
+            Transformation(str(i)) for i in range(self.n_transformations)
+        ]
+        self.world = World(
+            self.items, self.zones, self.zones_items, self.transformations
+        )
 
     def test_slot_from_item(self):
         item_3 = self.items[3]
@@ -29,3 +35,21 @@ class TestWorld:
     def test_slot_from_zoneitem(self):
         zone_3 = self.zones_items[1]
         check.equal(self.world.slot_from_zoneitem(zone_3), 1)
+
+    def test_slot_from_transformation(self):
+        transformation_4 = self.transformations[4]
+        check.equal(self.world.slot_from_transformation(transformation_4), 4)
+
+    def test_player_item_sources(self):
+        item_0, item_1 = self.items[:2]
+        search_0 = Transformation(inventory_changes=[Yield(PLAYER, item_0)])
+        double_0 = Transformation(
+            inventory_changes=[Use(PLAYER, item_0), Yield(PLAYER, item_0, create=2)]
+        )
+        craft_1 = Transformation(
+            inventory_changes=[Use(PLAYER, item_0), Yield(PLAYER, item_1)]
+        )
+        world = World(self.items, [], [], [search_0, double_0, craft_1])
+        check.equal(world.player_item_sources(item_0), [search_0])
+        check.equal(world.player_item_sources(item_1), [craft_1])
+        check.equal(world.player_item_sources(self.items[2]), [])